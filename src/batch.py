@@ -0,0 +1,129 @@
+# Advent of Code 2023, Batch Runner
+# (c) blu3r4y
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from inputs import PuzzleInput
+from lazy import preload
+from run import ANSWERS, load_input, solver
+
+
+def main(args):
+    if args.generate:
+        inputs = generated_inputs(args.day, args.generate, args.size)
+    else:
+        inputs = input_files(args.inputs or ["-"])
+
+    count, start = 0, time.perf_counter()
+    for record in solve_batch(args.day, inputs, args.workers):
+        print(json.dumps(record, default=int), flush=True)
+        count += 1
+    wall = time.perf_counter() - start
+
+    # the results own stdout, so that they can be piped somewhere else
+    rate = count / wall if wall > 0 else 0
+    print(f"{count} inputs in {wall:.1f} sec, {rate:.1f} inputs/sec", file=sys.stderr)
+
+    return 0
+
+
+def solve_batch(day, inputs, workers=None, backlog=4):
+    # the workers import the day once and then solve input after input,
+    # while only a few inputs per worker are read ahead of time
+    workers = workers or os.cpu_count()
+    inputs = iter(inputs)
+
+    with ProcessPoolExecutor(workers, initializer=warm_up, initargs=(day,)) as pool:
+        pending = set()
+        while True:
+            for name, data in inputs:
+                pending.add(pool.submit(solve_input, day, name, data))
+                if len(pending) >= workers * backlog:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (f.result() for f in done)
+
+
+def warm_up(day):
+    preload(importlib.import_module(f"day{day}"))
+
+
+def solve_input(day, name, data):
+    module = importlib.import_module(f"day{day}")
+    record = {"input": name, "day": day}
+
+    for part in (p for d, p in ANSWERS if d == day):
+        # one failing input should not stop the whole batch
+        try:
+            tstart = time.perf_counter()
+            parsed = load_input(module, part, data)
+            tload = time.perf_counter()
+            answer = solver(module, part)(parsed)
+            tsolve = time.perf_counter()
+        except Exception as e:
+            record[f"part{part}"] = {"error": repr(e)}
+            continue
+
+        record[f"part{part}"] = {
+            "answer": answer,
+            "load": round((tload - tstart) * 1000, 3),
+            "solve": round((tsolve - tload) * 1000, 3),
+        }
+
+    return record
+
+
+def input_files(paths):
+    for path in map(Path, paths):
+        if str(path) == "-":
+            yield from input_stream(sys.stdin)
+        elif path.is_dir():
+            for file in sorted(p for p in path.iterdir() if p.is_file()):
+                yield str(file), PuzzleInput(file).text
+        else:
+            yield str(path), PuzzleInput(path).text
+
+
+def input_stream(fh):
+    # one json object per line, with the name and the text of an input
+    for line in fh:
+        if line.strip():
+            obj = json.loads(line)
+            yield obj["name"], obj["input"].rstrip("\r\n")
+
+
+def generated_inputs(day, count, size=None):
+    from generators import GENERATORS, generate
+
+    size = size or GENERATORS[day][1]
+    for seed in range(count):
+        yield f"seed{seed}", generate(day, size, seed)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Solve a batch of inputs of one day")
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", nargs="*", help="input files or directories, - for json lines"
+    )
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "-g", "--generate", type=int, help="solve this many generated inputs instead"
+    )
+    parser.add_argument("-s", "--size", type=int, help="size of the generated inputs")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,357 @@
+# Advent of Code 2023, Benchmarks
+# (c) blu3r4y
+
+import argparse
+import importlib
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from unicodedata import east_asian_width
+
+from generators import GENERATORS, generate
+from inputs import read_input
+from memory import format_bytes, reset_caches, trace_memory
+from run import ANSWERS, README, load_input, solver
+
+
+def main(args):
+    if args.scaling:
+        results = scaling(args.days, args.scaling, args.repeat, args.budget)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fh:
+                json.dump(results, fh, indent=2)
+        return 0
+
+    if args.results:
+        with open(args.results, encoding="utf-8") as fh:
+            results = json.load(fh)
+    else:
+        results = benchmark(
+            args.days, args.warmup, args.repeat, args.budget, args.memory
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        status = compare(
+            results, baseline, args.threshold, args.noise, args.memory_noise
+        )
+    else:
+        print_results(results)
+
+    if args.readme:
+        update_readme(results)
+
+    # parts that failed to run are not measured, which is a failure as well
+    return 1 if results["meta"].get("failed") else status
+
+
+def benchmark(days, warmup, repeat, budget, memory=False):
+    results, failed = {}, {}
+    for day, part in ANSWERS:
+        if day not in days:
+            continue
+
+        key = f"{day}.{part}"
+        module = importlib.import_module(f"day{day}")
+
+        # one failing part should not lose the results of all others
+        try:
+            data = read_input(day)
+            result = benchmark_part(module, part, data, warmup, repeat, budget)
+
+            # tracing allocations is slow, so it gets a separate run
+            if memory:
+                result["memory"] = measure_memory(module, part, data)
+        except Exception as e:
+            failed[key] = repr(e)
+            print(f"day {day} part {part}: failed ({e!r})")
+            continue
+
+        results[key] = result
+        print(f"day {day} part {part}: {result['solve']['median']:.2f} ms")
+
+    meta = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "failed": failed,
+    }
+
+    return {"meta": meta, "results": results}
+
+
+def benchmark_part(module, part, data, warmup, repeat, budget):
+    loads, solves = [], []
+    for i in range(warmup + repeat):
+        load_time, solve_time = measure(module, part, data)
+        if i >= warmup:
+            loads.append(load_time)
+            solves.append(solve_time)
+
+        # slow parts stop repeating once they used up their time budget
+        if i >= warmup and sum(loads) + sum(solves) > budget * 1000:
+            break
+
+    return {"load": summarize(loads), "solve": summarize(solves)}
+
+
+def scaling(days, factors, repeat, budget):
+    results = {}
+    for day, part in ANSWERS:
+        if day not in days:
+            continue
+
+        module = importlib.import_module(f"day{day}")
+        _, base, unit = GENERATORS[day]
+
+        points = []
+        for factor in factors:
+            size = round(base * factor)
+            data = generate(day, size)
+
+            # synthetic inputs might violate the assumptions of some parts
+            try:
+                runs = [measure(module, part, data) for _ in range(repeat)]
+            except Exception as e:
+                print(f"day {day} part {part}: failed at {size} {unit} ({e!r})")
+                break
+
+            load, solve = min(r[0] for r in runs), min(r[1] for r in runs)
+            points.append({"size": size, "load": load, "solve": solve})
+
+            # stop the sweep once a single run exceeds the time budget
+            if load + solve > budget * 1000:
+                break
+
+        sizes = [p["size"] for p in points]
+        exponent = {
+            "load": fit_exponent(sizes, [p["load"] for p in points]),
+            "solve": fit_exponent(sizes, [p["solve"] for p in points]),
+        }
+
+        key = f"{day}.{part}"
+        results[key] = {"unit": unit, "points": points, "exponent": exponent}
+        print_scaling(key, results[key])
+
+    return {"results": results}
+
+
+def fit_exponent(sizes, times):
+    # the slope of a line fitted in log-log space, i.e., time ~ size^exponent
+    if len(sizes) < 2:
+        return None
+
+    logs = [math.log(s) for s in sizes], [math.log(max(t, 1e-6)) for t in times]
+    slope, _ = statistics.linear_regression(*logs)
+    return slope
+
+
+def print_scaling(key, result):
+    day, part = key.split(".")
+    exponent = result["exponent"]["solve"]
+    exponent = "-" if exponent is None else f"{exponent:.2f}"
+
+    times = ", ".join(f"{p['size']}: {p['solve']:.1f} ms" for p in result["points"])
+    print(f"day {day} part {part}: n^{exponent} with n {result['unit']} ({times})")
+
+
+def measure(module, part, data):
+    reset_caches(module)
+
+    start = time.perf_counter_ns()
+    parsed = load_input(module, part, data)
+    loaded = time.perf_counter_ns()
+    solver(module, part)(parsed)
+    end = time.perf_counter_ns()
+
+    return (loaded - start) / 1e6, (end - loaded) / 1e6
+
+
+def measure_memory(module, part, data):
+    reset_caches(module)
+
+    _, stats = trace_memory(
+        lambda: solver(module, part)(load_input(module, part, data))
+    )
+    return {"peak_traced": stats.peak_traced, "top_sites": stats.top_sites}
+
+
+def summarize(samples):
+    p95 = max(samples)
+    if len(samples) > 1:
+        p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "p95": p95,
+    }
+
+
+def print_results(results):
+    print(
+        f"\n{'day':>3} {'part':>4} {'load':>10} {'solve':>10} {'p95':>10} {'runs':>5}"
+    )
+    for key, r in results["results"].items():
+        day, part = key.split(".")
+        load, solve = r["load"]["median"], r["solve"]["median"]
+        p95, runs = r["solve"]["p95"], r["solve"]["runs"]
+
+        memory = ""
+        if "memory" in r:
+            memory = f" {format_bytes(r['memory']['peak_traced']):>12}"
+
+        times = f"{load:>7.2f} ms {solve:>7.2f} ms {p95:>7.2f} ms"
+        print(f"{day:>3} {part:>4} {times} {runs:>5}{memory}")
+
+
+def compare(results, baseline, threshold, noise, memory_noise):
+    regressions = 0
+
+    print(f"{'day':>3} {'part':>4} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key, r in results["results"].items():
+        if key not in baseline["results"]:
+            continue
+
+        day, part = key.split(".")
+        base = baseline["results"][key]
+
+        # only flag slowdowns that are both relevant and above the noise level
+        ratio, regressed = compare_value(
+            base["solve"]["median"], r["solve"]["median"], threshold, noise
+        )
+        regressions += regressed
+
+        flag = "  REGRESSION" if regressed else ""
+        times = f"{base['solve']['median']:>9.2f} ms {r['solve']['median']:>9.2f} ms"
+        print(f"{day:>3} {part:>4} {times} {ratio:>7.2f}{flag}")
+
+        # the same goes for the peak memory, if it was measured
+        if "memory" in r and "memory" in base:
+            bmem, cmem = base["memory"]["peak_traced"], r["memory"]["peak_traced"]
+            ratio, regressed = compare_value(
+                bmem, cmem, threshold, memory_noise * 2**20
+            )
+            regressions += regressed
+
+            flag = "  REGRESSION" if regressed else ""
+            sizes = f"{format_bytes(bmem):>12} {format_bytes(cmem):>12}"
+            print(f"{'':>3} {'mem':>4} {sizes} {ratio:>7.2f}{flag}")
+
+    print(f"\n{regressions} regressions above {threshold:.0%} and the noise level")
+    return 1 if regressions else 0
+
+
+def compare_value(base, curr, threshold, noise):
+    ratio = curr / base if base > 0 else float("inf")
+    return ratio, ratio > 1 + threshold and curr - base > noise
+
+
+def update_readme(results):
+    lines = README.read_text(encoding="utf-8").splitlines()
+
+    # locate the puzzle table, which is the first table of the readme
+    start = next(i for i, line in enumerate(lines) if line.startswith("|"))
+    end = next(i for i in range(start, len(lines)) if not lines[i].startswith("|"))
+    rows = [
+        [c.strip() for c in line.strip().strip("|").split("|")]
+        for line in lines[start:end]
+    ]
+
+    header, aligns, body = rows[0], rows[1], rows[2:]
+    for row in body:
+        for part, col in ((1, 3), (2, 4)):
+            if r := results["results"].get(f"{row[0]}.{part}"):
+                row[col] = format_duration(r["solve"]["median"])
+
+    lines[start:end] = format_table(header, aligns, body)
+    README.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def format_duration(ms):
+    # empty durations indicate a runtime of less than ten milliseconds
+    # and bold durations indicate a runtime of more than one minute
+    if ms < 10:
+        return "-"
+    if ms < 60000:
+        return f"{round(ms):,} ms".replace(",", ".")
+
+    minutes, seconds = divmod(round(ms / 1000), 60)
+    return f"**{minutes} min {seconds} sec**"
+
+
+def format_table(header, aligns, body):
+    rows = [header] + body
+    widths = [max(display_width(row[i]) for row in rows) for i in range(len(header))]
+    widths = [max(w, 3) for w in widths]
+
+    def format_row(row):
+        cells = []
+        for cell, align, width in zip(row, aligns, widths):
+            padding = " " * (width - display_width(cell))
+            cells.append(padding + cell if align.endswith(":") else cell + padding)
+        return "| " + " | ".join(cells) + " |"
+
+    def format_align(align, width):
+        left, right = align.startswith(":"), align.endswith(":")
+        return (":" if left else "-") + "-" * (width - 2) + (":" if right else "-")
+
+    separator = [format_align(a, w) for a, w in zip(aligns, widths)]
+    return [format_row(header), "| " + " | ".join(separator) + " |"] + [
+        format_row(r) for r in body
+    ]
+
+
+def display_width(text):
+    # emojis in the table header take up two columns
+    return sum(2 if east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark all days")
+    parser.add_argument("days", nargs="*", type=int, default=range(1, 26))
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-b", "--budget", type=float, default=10, help="seconds per part"
+    )
+    parser.add_argument("-o", "--output", help="save the results as json")
+    parser.add_argument(
+        "-r", "--results", help="use saved results instead of measuring"
+    )
+    parser.add_argument(
+        "-c", "--compare", help="compare against saved baseline results"
+    )
+    parser.add_argument("-t", "--threshold", type=float, default=0.1)
+    parser.add_argument("--noise", type=float, default=1, help="ignored slowdown in ms")
+    parser.add_argument("-m", "--memory", action="store_true", help="trace memory")
+    parser.add_argument(
+        "--memory-noise", type=float, default=1, help="ignored growth in MiB"
+    )
+    parser.add_argument("--readme", action="store_true", help="update the readme table")
+    parser.add_argument(
+        "-s",
+        "--scaling",
+        nargs="+",
+        type=float,
+        help="sweep synthetic inputs of these multiples of the base size",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,153 @@
+# Advent of Code 2023, Solver Daemon
+# (c) blu3r4y
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from inputs import PuzzleInput, read_input
+from lazy import preload
+from run import load_input, solver
+
+SOCKET = Path(__file__).parent.parent / ".cache" / "daemon.sock"
+SOCKET = Path(os.environ.get("AOC_DAEMON_SOCKET", SOCKET))
+
+# dependencies that some days only import within their parts
+DEFERRED = ("scipy.interpolate", "sympy")
+
+
+def main(args):
+    if args.command == "serve":
+        return serve(args.socket, args.workers)
+
+    for part in args.parts:
+        response = request(args.socket, args.day, part, input_path=args.input)
+        print(json.dumps(response))
+
+    return 0
+
+
+def serve(path=SOCKET, workers=None):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(workers, initializer=warm_up) as pool:
+        # start all workers right away, so that the first requests are fast too
+        for future in [pool.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                # one json request per line, answered by one json line each
+                for line in self.rfile:
+                    try:
+                        response = pool.submit(solve_request, line).result()
+                        response = json.dumps(response, default=int)
+                    except Exception as e:
+                        # the client still gets an answer if a worker breaks
+                        response = json.dumps({"error": repr(e)})
+                    self.wfile.write(response.encode() + b"\n")
+
+        server = socketserver.ThreadingUnixStreamServer(str(path), Handler)
+        server.daemon_threads = True
+
+        # stop gracefully when terminated, just like on ctrl+c
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        print(f"listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+
+    return 0
+
+
+def warm_up():
+    for day in range(1, 26):
+        preload(importlib.import_module(f"day{day}"))
+
+    for name in DEFERRED:
+        importlib.import_module(name)
+
+
+def solve_request(line):
+    day = part = None
+
+    # even a malformed request is answered, so that the client does not hang
+    try:
+        req = json.loads(line)
+        day, part = req["day"], req["part"]
+
+        # the input can be sent along, referenced by path, or the puzzle input
+        if "input" in req:
+            data = req["input"].rstrip("\r\n")
+        elif "path" in req:
+            data = PuzzleInput(req["path"]).text
+        else:
+            data = read_input(day)
+
+        module = importlib.import_module(f"day{day}")
+
+        tstart = time.perf_counter()
+        parsed = load_input(module, part, data)
+        tload = time.perf_counter()
+        answer = solver(module, part)(parsed)
+        tsolve = time.perf_counter()
+    except Exception as e:
+        return {"day": day, "part": part, "error": repr(e)}
+
+    return {
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "load": round((tload - tstart) * 1000, 3),
+        "solve": round((tsolve - tload) * 1000, 3),
+    }
+
+
+def request(path, day, part, data=None, input_path=None):
+    req = {"day": day, "part": part}
+    if data is not None:
+        req["input"] = data
+    elif input_path is not None:
+        req["path"] = str(Path(input_path).resolve())
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(req).encode() + b"\n")
+        with sock.makefile("rb") as fh:
+            return json.loads(fh.readline())
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Solve days with warm interpreters")
+    parser.add_argument("-S", "--socket", default=SOCKET, help="path of the socket")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="start the daemon")
+    serve_parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+
+    solve_parser = commands.add_parser("solve", help="send a request to the daemon")
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("parts", nargs="*", type=int, default=[1, 2])
+    solve_parser.add_argument("-i", "--input", help="input file, or the puzzle input")
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
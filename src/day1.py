@@ -1,61 +1,194 @@
 # Advent of Code 2023, Day 1
 # (c) blu3r4y
 
-import re
-
-from aocd.models import Puzzle
-from funcy import lfilter, print_calls, print_durations
-
-NUMS_REGEX_PATTERN = r"(?=(\d|one|two|three|four|five|six|seven|eight|nine))"
-NUMS_REGEX = re.compile(NUMS_REGEX_PATTERN)
-NUMS = {
-    "zero": "0",
-    "one": "1",
-    "two": "2",
-    "three": "3",
-    "four": "4",
-    "five": "5",
-    "six": "6",
-    "seven": "7",
-    "eight": "8",
-    "nine": "9",
+import os
+import sys
+from collections import deque
+from functools import cache
+
+from inputs import PuzzleInput, puzzle_input, read_input, split_lines
+from instrument import instrument
+from lazy import lazy_import, preload
+
+np = lazy_import("numpy")
+
+NEWLINE, ZERO = ord("\n"), ord("0")
+
+# more chunks than workers, so that a slow chunk does not stall the others
+CHUNKS_PER_WORKER = 4
+
+DIGITS = {str(d).encode(): d for d in range(10)}
+WORDS = {
+    b"one": 1,
+    b"two": 2,
+    b"three": 3,
+    b"four": 4,
+    b"five": 5,
+    b"six": 6,
+    b"seven": 7,
+    b"eight": 8,
+    b"nine": 9,
 }
 
 
-@print_calls
-@print_durations(unit="ms")
-def part1(lines):
-    total = 0
-    for line in lines:
-        line = lfilter(lambda x: x.isnumeric(), line)
-        total += int(line[0] + line[-1])
+def automaton(patterns):
+    # an aho-corasick automaton as a dense transition table over bytes,
+    # with one row of 256 successor states per state, and the value of
+    # the pattern that ends in each state, or None
+    trie, output = [{}], [None]
+    for pattern, value in patterns.items():
+        state = 0
+        for byte in pattern:
+            if byte not in trie[state]:
+                trie[state][byte] = len(trie)
+                trie.append({})
+                output.append(None)
+            state = trie[state][byte]
+        output[state] = value
 
-    return total
+    # breadth-first, so that the fallback of each state is already complete
+    table = [0] * (256 * len(trie))
+    queue = deque((child, 0) for child in trie[0].values())
+    for byte, child in trie[0].items():
+        table[byte] = child
+
+    while queue:
+        state, fallback = queue.popleft()
+        if output[state] is None:
+            output[state] = output[fallback]
+
+        row = 256 * state
+        table[row : row + 256] = table[256 * fallback : 256 * fallback + 256]
+        for byte, child in trie[state].items():
+            table[row + byte] = child
+            queue.append((child, table[256 * fallback + byte]))
 
+    return table, output
 
-@print_calls
-@print_durations(unit="ms")
+
+def first_match(line, scanner):
+    # the value of the pattern that ends first, which is also the one that
+    # starts first, as long as no pattern is contained within another one
+    table, output = scanner
+    state = 0
+    for byte in line:
+        state = table[256 * state + byte]
+        if (value := output[state]) is not None:
+            return value
+
+    return None
+
+
+# patterns are reversed for scanning lines backwards, from their end
+PART1 = automaton(DIGITS), automaton({k[::-1]: v for k, v in DIGITS.items()})
+PART2 = automaton(DIGITS | WORDS), automaton(
+    {k[::-1]: v for k, v in (DIGITS | WORDS).items()}
+)
+
+
+@instrument
+def part1(lines):
+    return calibration(lines, *PART1)
+
+
+@instrument
 def part2(lines):
+    return calibration(lines, *PART2)
+
+
+@instrument
+def part1_vectorized(buffer):
+    # the same as part1, but over the raw bytes of the whole input at once,
+    # e.g., PuzzleInput.bytes, which is a view onto the memory-mapped file
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+
+    array = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(array == NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(array)]))
+
+    # anything below zero wraps around and ends up above nine as well
+    digits = np.flatnonzero(array - np.uint8(ZERO) < 10)
+    values = array[digits] - np.uint8(ZERO)
+
+    # digit positions are sorted, so each line is a segment of them,
+    # of which only the first and last one matter (lines without any are skipped)
+    lo, hi = np.searchsorted(digits, starts), np.searchsorted(digits, ends)
+    lo, hi = lo[hi > lo], hi[hi > lo]
+
+    return int(10 * values[lo].sum(dtype=np.int64) + values[hi - 1].sum(dtype=np.int64))
+
+
+def calibration(lines, forward, backward):
     total = 0
     for line in lines:
-        numbers = NUMS_REGEX.findall(line)
-        numbers = [NUMS.get(n, n) for n in numbers]
-        total += int(numbers[0] + numbers[-1])
+        total += 10 * first_match(line, forward) + first_match(line[::-1], backward)
 
     return total
 
 
+def solve_parallel(path, part, workers=None):
+    # huge input files are split into chunks that end at line boundaries,
+    # where part 1 runs in threads, since numpy releases the gil, and part 2
+    # in processes, which all map the same file and thus share its pages
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    # lazy imports are not thread-safe, so numpy is imported before any thread
+    preload(sys.modules[__name__])
+
+    workers = workers or os.cpu_count()
+    bounds = chunk_bounds(mapped(path), workers * CHUNKS_PER_WORKER)
+
+    executor = ThreadPoolExecutor if part == 1 else ProcessPoolExecutor
+    with executor(workers) as pool:
+        futures = [pool.submit(chunk_sum, path, part, *b) for b in bounds]
+        return sum(f.result() for f in futures)
+
+
+def chunk_bounds(puzzle, nchunks):
+    end = len(puzzle.bytes)
+    bounds, start = [], 0
+    for i in range(1, nchunks + 1):
+        stop = puzzle.buffer.find(b"\n", max(start, end * i // nchunks), end)
+        stop = end if stop < 0 or i == nchunks else stop
+        if stop > start:
+            bounds.append((start, stop))
+        start = stop + 1
+
+    return bounds
+
+
+def chunk_sum(path, part, start, stop):
+    chunk = mapped(path).bytes[start:stop]
+    if part == 1:
+        return part1_vectorized(chunk)
+
+    lines = (line for line in bytes(chunk).split(b"\n") if line)
+    return calibration(lines, *PART2)
+
+
+@cache
+def mapped(path):
+    # every process maps the file only once
+    return PuzzleInput(path)
+
+
 def load(data):
-    return data.split("\n")
+    for line in split_lines(data):
+        yield line.encode()
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=1)
+    data = read_input(1)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 54667
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    # before anything else imports numpy, to cover the cold start of the threads
+    assert solve_parallel(puzzle_input(1).path, 1) == ans1
+    assert part1_vectorized(puzzle_input(1).bytes) == ans1
+
+    ans2 = part2(load(data))
     assert ans2 == 54203
-    puzzle.answer_b = ans2
+    assert solve_parallel(puzzle_input(1).path, 2) == ans2
@@ -1,11 +1,15 @@
 # Advent of Code 2023, Day 10
 # (c) blu3r4y
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import pairwise, print_calls, print_durations
+from funcy import pairwise
+
+from grid import PADDING, Grid
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
+
+nx = lazy_import("networkx")
 
-ALL_NEIGHBORS = ((0, 1), (1, 0), (0, -1), (-1, 0))
 PIPE_NEIGHBORS = {
     "|": ((0, -1), (0, 1)),
     "-": ((-1, 0), (1, 0)),
@@ -18,10 +22,9 @@ PIPE_NEIGHBORS = {
 }
 
 
-@print_calls
-@print_durations(unit="ms")
-def part1(cells):
-    G, start = build_graph(cells)
+@instrument
+def part1(grid):
+    G, start = build_graph(grid)
 
     # find longest path from start to any other point,
     # but only consider the subgraph that is reachable from start
@@ -29,41 +32,49 @@ def part1(cells):
     return nx.eccentricity(G.subgraph(loop), start)
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(cells):
-    G, start = build_graph(cells)
+@instrument
+def part2(grid):
+    G, start = build_graph(grid)
 
     # find (any) loop that is reachable from the start
-    cycle = [u for u, v in nx.find_cycle(G, start)]
+    cycle = [grid.coords(u) for u, v in nx.find_cycle(G, start)]
 
     # compute the polygon area and derive the number of inner grid points
     area = compute_positive_polygon_area(cycle)
     return compute_points_inside_polygon(area, len(cycle))
 
 
-def build_graph(cells):
+def build_graph(grid):
     G = nx.DiGraph()
 
-    for x, y in cells:
-        G.add_node((x, y))
-        for px, py in neighbors(x, y, cells):
-            G.add_node((px, py))
-            G.add_edge((x, y), (px, py))
+    # the offsets of the pipe neighbors within the flat grid
+    offsets = {
+        ord(pipe): tuple(dy * grid.stride + dx for dx, dy in deltas)
+        for pipe, deltas in PIPE_NEIGHBORS.items()
+    }
+
+    cells = grid.cells.tobytes()
+    for pos in range(len(cells)):
+        if cells[pos] == PADDING:
+            continue
+
+        G.add_node(pos)
+        for nxt in neighbors(pos, cells, offsets):
+            G.add_node(nxt)
+            G.add_edge(pos, nxt)
 
     # add missing out edges from start node
-    start = next((pos for pos, v in cells.items() if v == "S"))
+    start = int(grid.find("S")[0])
     for v1, v2 in G.in_edges(start):
         G.add_edge(v2, v1)
 
     return G.to_undirected(reciprocal=True), start
 
 
-def neighbors(x, y, cells):
-    for dx, dy in PIPE_NEIGHBORS[cells[(x, y)]]:
-        px, py = x + dx, y + dy
-        if (px, py) in cells:
-            yield px, py
+def neighbors(pos, cells, offsets):
+    for delta in offsets[cells[pos]]:
+        if cells[pos + delta] != PADDING:
+            yield pos + delta
 
 
 def compute_positive_polygon_area(vert):
@@ -93,21 +104,14 @@ def compute_points_inside_polygon(area, num_edges):
 
 
 def load(data):
-    cells = {}
-    for y, row in enumerate(data.split("\n")):
-        for x, cell in enumerate(row):
-            cells[(x, y)] = cell
-
-    return cells
+    return Grid.from_bytes(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=10)
+    data = read_input(10)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 6828
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 459
-    puzzle.answer_b = ans2
@@ -3,18 +3,16 @@
 
 from itertools import combinations
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from inputs import read_input
+from instrument import instrument
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(galaxies):
     return total_pairwise_distances(galaxies, factor=1)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(galaxies, factor=999999):
     return total_pairwise_distances(galaxies, factor=factor)
 
@@ -62,12 +60,10 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=11)
+    data = read_input(11)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 9965032
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 550358864332
-    puzzle.answer_b = ans2
@@ -1,16 +1,16 @@
 # Advent of Code 2023, Day 12
 # (c) blu3r4y
 
-from functools import cache
+from funcy import lmap
 
-from aocd.models import Puzzle
-from funcy import collecting, lmap, print_calls, print_durations
+from inputs import read_input, split_lines
+from instrument import counting_cache, instrument
+from memo import clear, memoize
 
 GAP, MARK, WILDCARD = ".", "#", "?"
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(data):
     total = 0
     for springs, checksum in data:
@@ -19,8 +19,7 @@ def part1(data):
     return total
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(data):
     total = 0
     for springs, checksum in data:
@@ -32,10 +31,16 @@ def part2(data):
 
 
 def number_of_arrangements(springs, checksum):
-    return dp(springs + (GAP,), checksum)
+    with counting_cache(dp, "day12.dp"):
+        result = dp(springs + (GAP,), checksum)
 
+    # the entries of one row hardly ever match the ones of the next row,
+    # so they are dropped, instead of filling up the budget until eviction
+    clear("day12.dp")
+    return result
 
-@cache
+
+@memoize("day12.dp")
 def dp(springs, checksum, open=False):
     symbol, check = springs[0], checksum[0]
     eos, eoc = len(springs) == 1, len(checksum) == 1
@@ -77,21 +82,18 @@ def dp(springs, checksum, open=False):
             return a + b
 
 
-@collecting
 def load(data):
-    for line in data.split("\n"):
+    for line in split_lines(data):
         springs, checksum = line.split(" ")
         checksum = lmap(int, checksum.split(","))
         yield tuple(springs), tuple(checksum)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=12)
+    data = read_input(12)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 7047
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 17391848518844
-    puzzle.answer_b = ans2
@@ -1,26 +1,29 @@
 # Advent of Code 2023, Day 13
 # (c) blu3r4y
 
-import numpy as np
-from aocd.models import Puzzle
-from funcy import collecting, print_calls, print_durations
+from funcy import collecting
 
+from grid import Grid
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
 
-@print_calls
-@print_durations(unit="ms")
+np = lazy_import("numpy")
+
+
+@instrument
 def part1(grid):
     return solve(grid, 0)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(grid):
     return solve(grid, 1)
 
 
 def solve(grid, num_smudges):
     total = 0
-    for block in grid:
+    for block in (pattern.array for pattern in grid):
         if x := find_reflection(block, num_smudges):
             total += x
         if y := find_reflection(block.T, num_smudges):
@@ -48,20 +51,15 @@ def find_reflection(block, num_smudges=0):
 
 @collecting
 def load(data):
-    mapping = {".": 0, "#": 1}
     for block in data.split("\n\n"):
-        rows = block.split("\n")
-        rows = [[mapping[cell] for cell in row] for row in rows]
-        yield np.array(rows, dtype=int)
+        yield Grid.from_bytes(block, pad=0)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=13)
+    data = read_input(13)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 31877
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 42996
-    puzzle.answer_b = ans2
@@ -1,26 +1,30 @@
 # Advent of Code 2023, Day 14
 # (c) blu3r4y
 
-from collections import defaultdict
+from grid import Grid
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
+from shared import writable
 
-import numpy as np
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+np = lazy_import("numpy")
 
-EMPTY, ROCK, DISH = 0, 1, 2
+EMPTY, ROCK, DISH = ord("."), ord("#"), ord("O")
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(grid):
+    grid = writable(grid.array)
     roll_rocks(grid)
     return beam_load(grid)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(grid, cycles=1000000000):
-    cyclecache = defaultdict(int)
+    grid = writable(grid.array)
+    # the grids that were seen so far, which must all be kept to find the cycle,
+    # but are bounded by the grids before the cycle and the cycle itself
+    cyclecache = {}
 
     c = 0
     while c < cycles:
@@ -33,7 +37,7 @@ def part2(grid, cycles=1000000000):
 
         # check if we have seen this grid before
         # and if so, skip forward close to the end
-        key = tuple(grid.ravel())
+        key = grid.tobytes()
         if cstart := cyclecache.get(key):
             cycle_length = c - cstart
             n_repeat = (cycles - c) // cycle_length
@@ -46,46 +50,31 @@ def part2(grid, cycles=1000000000):
 
 
 def roll_rocks(grid):
-    nrows, ncols = grid.shape
-
-    for x in range(ncols):
-        yfree = 0  # north-most free row
-
-        for y in range(nrows):
-            if grid[y, x] == ROCK:
-                yfree = y + 1
-            elif grid[y, x] == DISH:
-                grid[y, x] = EMPTY
-                grid[yfree, x] = DISH
-                yfree += 1
+    for x in range(grid.shape[1]):
+        # the dishes roll to the north end of the gaps between the rocks,
+        # which is where they end up when sorting the gaps in reverse
+        column = grid[:, x].tobytes().split(bytes([ROCK]))
+        column = bytes([ROCK]).join(bytes(sorted(gap, reverse=True)) for gap in column)
+        grid[:, x] = np.frombuffer(column, dtype=np.uint8)
 
 
 def beam_load(grid):
-    nrows, ncols = grid.shape
-    total = 0
-
-    for x in range(ncols):
-        cells = enumerate(grid[:, x])
-        score = (nrows - i for i, cell in cells if cell == DISH)
-        total += sum(score)
+    nrows, _ = grid.shape
 
-    return total
+    # every dish contributes its distance to the south edge
+    score = np.arange(nrows, 0, -1)
+    return int(np.sum((grid == DISH) * score[:, None]))
 
 
 def load(data):
-    mapping = {".": EMPTY, "#": ROCK, "O": DISH}
-    rows = data.split("\n")
-    rows = [[mapping[cell] for cell in row] for row in rows]
-    return np.array(rows, dtype=int)
+    return Grid.from_bytes(data, pad=0)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=14)
+    data = read_input(14)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 106186
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 106390
-    puzzle.answer_b = ans2
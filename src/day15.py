@@ -1,12 +1,12 @@
 # Advent of Code 2023, Day 15
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
 
+from inputs import read_input, split_records
+from instrument import instrument
 
-@print_calls
-@print_durations(unit="ms")
+
+@instrument
 def part1(steps):
     total = 0
     for step in steps:
@@ -15,8 +15,7 @@ def part1(steps):
     return total
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(steps):
     boxes = [[] for _ in range(256)]
     lenses = [{} for _ in range(256)]
@@ -66,16 +65,14 @@ def parse_step(step):
 
 
 def load(data):
-    return data.split(",")
+    return split_records(data, ",")
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=15)
+    data = read_input(15)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 514025
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 244461
-    puzzle.answer_b = ans2
@@ -3,100 +3,94 @@
 
 from itertools import chain
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import DOWN, LEFT, PADDING, RIGHT, UP, Grid
+from inputs import read_input
+from instrument import counters, instrument
 
-EMPTY, MIRROR_RL, MIRROR_LR, SPLITTER_V, SPLITTER_H = ".", "/", "\\", "|", "-"
+EMPTY, MIRROR_RL, MIRROR_LR, SPLITTER_V, SPLITTER_H = map(ord, "./\\|-")
 
 
-@print_calls
-@print_durations(unit="ms")
-def part1(data):
-    grid, xmax, ymax = data
-    return number_of_energized_tiles(grid, xmax, ymax, 0, 1)
+@instrument
+def part1(grid):
+    return number_of_energized_tiles(grid, grid.index(0, 0), RIGHT)
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
-    grid, xmax, ymax = data
+@instrument
+def part2(grid):
+    xmax, ymax = grid.width - 1, grid.height - 1
 
     edge = chain(
-        ((x, 1j) for x in range(xmax + 1)),
-        ((x + ymax * 1j, -1j) for x in range(xmax + 1)),
-        ((y * 1j, 1) for y in range(ymax + 1)),
-        ((xmax + y * 1j, -1) for y in range(ymax + 1)),
+        ((grid.index(x, 0), DOWN) for x in range(xmax + 1)),
+        ((grid.index(x, ymax), UP) for x in range(xmax + 1)),
+        ((grid.index(0, y), RIGHT) for y in range(ymax + 1)),
+        ((grid.index(xmax, y), LEFT) for y in range(ymax + 1)),
     )
 
     max_energy = 0
     for start, direction in edge:
-        energy = number_of_energized_tiles(grid, xmax, ymax, start, direction)
+        energy = number_of_energized_tiles(grid, start, direction)
         max_energy = max(max_energy, energy)
 
     return max_energy
 
 
-def number_of_energized_tiles(grid, xmax, ymax, start, direction):
+def number_of_energized_tiles(grid, start, direction):
+    cells, offsets = grid.cells.tobytes(), grid.directions
     beams = [(start, direction)]
-    touched = {start}
-    beamcache = set()
+    count = counters("day16.number_of_energized_tiles")
+
+    # one bit per orientation that already passed through a cell
+    beamcache = bytearray(len(cells))
 
     while beams:
         pos, orient = beams.pop()
+        if count is not None:
+            count["beams"] += 1
 
         # keep going until we hit the edge
-        while 0 <= pos.real <= xmax and 0 <= pos.imag <= ymax:
-            if (pos, orient) in beamcache:
+        while cells[pos] != PADDING:
+            if beamcache[pos] & (1 << orient):
+                if count is not None:
+                    count["cache_hits"] += 1
                 break  # already visited
 
-            beamcache.add((pos, orient))
-            touched.add(pos)
+            beamcache[pos] |= 1 << orient
 
             # continue if we hit empty space
-            symbol = grid.get(pos)
-            if not symbol:
+            symbol = cells[pos]
+            if symbol == EMPTY:
                 pass
 
             # change orientation if we hit a mirror
             elif symbol == MIRROR_RL:
-                orient *= 1j if orient.imag else -1j
+                orient = 3 - orient
             elif symbol == MIRROR_LR:
-                orient *= -1j if orient.imag else 1j
+                orient ^= 1
 
             # split the beam if we hit a splitter
-            elif symbol == SPLITTER_V and not orient.imag:
-                beams.append((pos, orient * 1j))
-                beams.append((pos, orient * -1j))
+            elif symbol == SPLITTER_V and orient in (LEFT, RIGHT):
+                beams.append((pos, UP))
+                beams.append((pos, DOWN))
                 break
-            elif symbol == SPLITTER_H and not orient.real:
-                beams.append((pos, orient * 1j))
-                beams.append((pos, orient * -1j))
+            elif symbol == SPLITTER_H and orient in (UP, DOWN):
+                beams.append((pos, LEFT))
+                beams.append((pos, RIGHT))
                 break
 
-            pos += orient
+            pos += offsets[orient]
 
-    return len(touched)
+    return len(beamcache) - beamcache.count(0)
 
 
 def load(data):
-    grid, xmax, ymax = {}, 0, 0
-    for y, line in enumerate(data.split("\n")):
-        ymax = max(ymax, y)
-        for x, char in enumerate(line):
-            xmax = max(xmax, x)
-            if char != EMPTY:
-                grid[x + y * 1j] = char
-
-    return grid, xmax, ymax
+    return Grid.from_bytes(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=16)
+    data = read_input(16)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 8389
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 8564
-    puzzle.answer_b = ans2
@@ -4,37 +4,40 @@
 from collections import namedtuple
 from queue import PriorityQueue
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import DOWN, RIGHT, Grid
+from inputs import read_input
+from instrument import counters, instrument
 
 # current position, orientation, and number of steps steps taken
 State = namedtuple("State", ["pos", "orient", "steps"])
 
 
-@print_calls
-@print_durations(unit="ms")
-def part1(data):
-    heatmap, goal = data
-    return solve(heatmap, start=0, goal=goal, smin=0, smax=3)
+@instrument
+def part1(grid):
+    return solve(grid, smin=0, smax=3)
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
-    heatmap, goal = data
-    return solve(heatmap, start=0, goal=goal, smin=4, smax=10)
+@instrument
+def part2(grid):
+    return solve(grid, smin=4, smax=10)
 
 
-def solve(heatmap, start, goal, smin, smax):
+def solve(grid, smin, smax):
+    start, goal = grid.index(0, 0), grid.index(grid.width - 1, grid.height - 1)
     starts = [  # start moving right or down
-        State(pos=start, orient=1, steps=0),
-        State(pos=start, orient=1j, steps=0),
+        State(pos=start, orient=RIGHT, steps=0),
+        State(pos=start, orient=DOWN, steps=0),
     ]
 
-    return astar_search(heatmap, starts, goal, goal, smin, smax)
+    return astar_search(grid, starts, goal, smin, smax)
 
 
-def astar_search(heatmap, starts, goal, limit, smin, smax):
+def astar_search(grid, starts, goal, smin, smax):
+    # the heat of every cell, where the padding marks the edge of the grid
+    heatmap = [cell - ord("0") if cell else None for cell in grid.cells.tobytes()]
+
+    count = counters("day17.astar_search")
+
     closed = {start: 0 for start in starts}
     openpq = PriorityQueue()
     tiebreaker = 0
@@ -44,61 +47,56 @@ def astar_search(heatmap, starts, goal, limit, smin, smax):
 
     while not openpq.empty():
         total_heat, _, current = openpq.get()
+        if count is not None:
+            count["pops"] += 1
+
         if current.pos == goal and current.steps >= smin:
+            if count is not None:
+                count["closed"] += len(closed)
             return total_heat
 
-        for succ in successor_states(current, limit, smin, smax):
+        for succ in successor_states(current, heatmap, grid.directions, smin, smax):
             new_heat = closed[current] + heatmap[succ.pos]
             if succ not in closed or new_heat < closed[succ]:
                 closed[succ] = new_heat
-                estimate = new_heat + remaining_manhattan_heat(succ, goal)
+                estimate = new_heat + remaining_manhattan_heat(grid, succ, goal)
                 openpq.put((estimate, tiebreaker, succ))
                 tiebreaker += 1
 
+                if count is not None:
+                    count["pushes"] += 1
+
 
-def successor_states(state, limit, smin, smax):
+def successor_states(state, heatmap, offsets, smin, smax):
     # go steps if we haven't been going steps for too long
     if state.steps < smax:
-        nxt = state.pos + state.orient
-        if within_grid_limits(nxt, limit):
+        nxt = state.pos + offsets[state.orient]
+        if heatmap[nxt] is not None:
             yield State(pos=nxt, orient=state.orient, steps=state.steps + 1)
 
     # turn right or left
     if smin <= state.steps <= smax:
-        for turn in (1j, -1j):
-            nxt = state.pos + (state.orient * turn)
-            if within_grid_limits(nxt, limit):
-                yield State(pos=nxt, orient=state.orient * turn, steps=1)
+        for turn in (1, -1):
+            orient = (state.orient + turn) % 4
+            nxt = state.pos + offsets[orient]
+            if heatmap[nxt] is not None:
+                yield State(pos=nxt, orient=orient, steps=1)
 
 
-def within_grid_limits(pos, bounds):
-    return 0 <= pos.real <= bounds.real and 0 <= pos.imag <= bounds.imag
-
-
-def remaining_manhattan_heat(state, goal) -> int:
-    a, b = goal, state.pos
-    return int(abs(a.imag - b.imag) + abs(a.real - b.real))
+def remaining_manhattan_heat(grid, state, goal) -> int:
+    (ax, ay), (bx, by) = grid.coords(goal), grid.coords(state.pos)
+    return abs(ay - by) + abs(ax - bx)
 
 
 def load(data):
-    heatmap = {}
-    lines = data.splitlines()
-    ncols, nrows = len(lines[0]), len(lines)
-    for y, line in enumerate(lines):
-        for x, heat in enumerate(line):
-            heatmap[x + y * 1j] = int(heat)
-
-    goal = ncols - 1 + (nrows - 1) * 1j
-    return heatmap, goal
+    return Grid.from_bytes(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=17)
+    data = read_input(17)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 755
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 881
-    puzzle.answer_b = ans2
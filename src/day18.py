@@ -3,21 +3,21 @@
 
 from collections import namedtuple
 
-from aocd.models import Puzzle
-from funcy import pairwise, print_calls, print_durations
-from parse import parse
+from funcy import pairwise
+
+from inputs import read_input
+from instrument import instrument
+from tokenizer import records
 
 Ins = namedtuple("Ins", ["action", "value"])
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(plan):
     return trench_area(plan)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(plan):
     return trench_area(plan)
 
@@ -82,24 +82,22 @@ def compute_points_inside_polygon(area, num_edges):
 def load(data, decode_hex=False):
     action_map = {"0": "R", "1": "D", "2": "L", "3": "U"}
 
-    plan = []
-    for line in data.split("\n"):
-        action, meters, color = parse("{} {:d} (#{})", line)
-        if decode_hex:
-            meters = int(color[:5], 16)
-            action = action_map[color[5]]
-        plan.append(Ins(action, meters))
+    actions, meters, colors = records(data, r"(\w) (\d+) \(#(\w+)\)")
+
+    if decode_hex:
+        actions = [action_map[color[5]] for color in colors]
+        meters = [int(color[:5], 16) for color in colors]
+
+    plan = [Ins(action, int(value)) for action, value in zip(actions, meters)]
 
     return plan
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=18)
+    data = read_input(18)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 95356
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data, decode_hex=True))
+    ans2 = part2(load(data, decode_hex=True))
     assert ans2 == 92291468914147
-    puzzle.answer_b = ans2
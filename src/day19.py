@@ -5,8 +5,8 @@ from collections import namedtuple
 from functools import reduce
 from operator import __ge__, __gt__, __le__, __lt__, mul
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from inputs import read_input
+from instrument import instrument
 
 Rule = namedtuple("Rule", ["key", "op", "val", "nxt"])
 
@@ -19,8 +19,7 @@ INVERSE_OPERATORS = {
 }
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(data):
     workflows, parts = data
 
@@ -32,8 +31,7 @@ def part1(data):
     return total_rating
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(data):
     workflows, _ = data
 
@@ -140,12 +138,10 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=19)
+    data = read_input(19)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 331208
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 121464316215623
-    puzzle.answer_b = ans2
@@ -1,72 +1,69 @@
 # Advent of Code 2023, Day 2
 # (c) blu3r4y
 
-from functools import reduce
-from operator import mul
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
+from tokenizer import scan
 
-from aocd.models import Puzzle
-from funcy import collecting, print_calls, print_durations
-from parse import parse
+np = lazy_import("numpy")
 
+# the columns of the games, i.e., their id and the most cubes shown per color
+ID, RED, GREEN, BLUE = range(4)
+COLORS = {"red": RED, "green": GREEN, "blue": BLUE}
 
-@print_calls
-@print_durations(unit="ms")
-def part1(games):
-    maxbag = {"red": 12, "green": 13, "blue": 14}
-    result = 0
-
-    for no, game in enumerate(games, 1):
-        game_possible = True
-        for cubeset in game:
-            thisbag = maxbag.copy()
-            for color, count in cubeset.items():
-                thisbag[color] -= count
+# the bag of part 1, in the order of the color columns
+BAG = (12, 13, 14)
 
-            possible = all(v >= 0 for v in thisbag.values())
-            game_possible &= possible
+# bags are compared against that many games at once, at most
+BATCH_SIZE = 2**22
 
-        result += no if game_possible else 0
 
-    return result
+@instrument
+def part1(games):
+    return int(possible_games(games, [BAG])[0])
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(games):
-    result = 0
-    for game in games:
-        minbag = {}
-        for cubeset in game:
-            for color, count in cubeset.items():
-                minbag[color] = max(minbag.get(color, 0), count)
+    # colors that never show up within a game do not count towards its power
+    return int(np.maximum(games[:, RED:], 1).prod(axis=1).sum())
 
-        power = reduce(mul, minbag.values())
-        result += power
 
-    return result
+def possible_games(games, bags):
+    # the sum of the ids of all games that are possible with each of the bags,
+    # i.e., where no color ever showed more cubes than there are in the bag
+    bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+    cubes, ids = games[:, RED:], games[:, ID]
 
+    step = max(1, BATCH_SIZE // max(len(games), 1))
+    sums = np.empty(len(bags), dtype=np.int64)
+    for i in range(0, len(bags), step):
+        batch = bags[i : i + step, np.newaxis, :]
+        sums[i : i + step] = (cubes <= batch).all(axis=2) @ ids
+
+    return sums
 
-@collecting
-def load(data):
-    for line in data.split("\n"):
-        _, game = parse("Game {:d}: {}", line).fixed
 
-        gameset = []
-        for cubeset in game.split(";"):
-            cubeset = [s.strip() for s in cubeset.split(",")]
-            cubeset = [parse("{:d} {}", s).fixed[::-1] for s in cubeset]
-            gameset.append(dict(cubeset))
+def load(data):
+    # the cube sets within a game do not matter, only the most cubes per color
+    rows = []
+    for match in scan(data, r"Game (\d+)|(\d+) (red|green|blue)"):
+        game, count, color = match.groups()
+        if game:
+            rows.append([int(game), 0, 0, 0])
+        else:
+            row, column = rows[-1], COLORS[color]
+            row[column] = max(row[column], int(count))
 
-        yield gameset
+    return np.array(rows, dtype=np.int64).reshape(-1, 4)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=2)
+    data = read_input(2)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 2169
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 60948
-    puzzle.answer_b = ans2
@@ -4,12 +4,13 @@
 from collections import defaultdict
 from math import lcm
 
-from aocd.models import Puzzle
-from funcy import collecting, print_calls, print_durations
+from funcy import collecting
 
+from inputs import read_input
+from instrument import counters, instrument
 
-@print_calls
-@print_durations(unit="ms")
+
+@instrument
 def part1(wiring):
     processor = build_processor(wiring)
     for _ in range(1000):
@@ -19,8 +20,7 @@ def part1(wiring):
     return result
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(wiring):
     processor = build_processor(wiring)
 
@@ -89,6 +89,11 @@ class Processor:
         self.num_pulses[False] += 1
         self.button_count += 1
 
+        # the number of pulses that every module received
+        count = counters("day20.pulses")
+        if count is not None:
+            count["broadcaster"] += 1
+
         stack = ["broadcaster"]
         while stack:
             module = self.modules[stack.pop(0)]
@@ -102,6 +107,8 @@ class Processor:
                 # propagate pulse to all outputs of the module and enqueue them
                 for output in module.outputs:
                     self.num_pulses[pulse] += 1
+                    if count is not None:
+                        count[output] += 1
                     if output in self.modules:
                         self.modules[output].on_receive(pulse, source=name)
                         stack.append(output)
@@ -171,12 +178,10 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=20)
+    data = read_input(20)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 929810733
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 231657829136023
-    puzzle.answer_b = ans2
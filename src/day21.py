@@ -1,31 +1,29 @@
 # Advent of Code 2023, Day 21
 # (c) blu3r4y
 
-import numpy as np
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from scipy.interpolate import CubicSpline
+from grid import Grid
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
 
-START, GARDEN, ROCK = "S", ".", "#"
+np = lazy_import("numpy")
 
+START, GARDEN, ROCK = "S", ".", "#"
 
-@print_calls
-@print_durations(unit="ms")
-def part1(data, nsteps=64):
-    rocks, bounds, start = data
 
+@instrument
+def part1(grid, nsteps=64):
     # only extract the number of reachable blocks in the last step
-    *_, num_reachable = reachable_blocks(nsteps, rocks, bounds, start)
+    *_, num_reachable = reachable_blocks(nsteps, grid)
     return num_reachable
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data, nsteps=26501365):
-    rocks, bounds, start = data
+@instrument
+def part2(grid, nsteps=26501365):
+    from scipy.interpolate import CubicSpline
 
-    period_start = int(start.real)
-    period_length = bounds[0]
+    period_start, _ = grid.coords(int(grid.find(START)[0]))
+    period_length = grid.height
 
     # after careful manual analysis of the lagplots, it turns out
     # that the number of reachable blocks is periodic with
@@ -33,7 +31,7 @@ def part2(data, nsteps=26501365):
     assert (nsteps - period_start) % period_length == 0
 
     # compute the steps to get three data points
-    history = reachable_blocks(period_start + 2 * period_length, rocks, bounds, start)
+    history = reachable_blocks(period_start + 2 * period_length, grid)
 
     # interpolate a cubic spline; though, it is probably just quadratic ...
     ys = np.array(history[period_start - 1 :: period_length])
@@ -45,53 +43,41 @@ def part2(data, nsteps=26501365):
     return int(spline(target_period))
 
 
-def reachable_blocks(nsteps, rocks, bounds, start):
-    fringe, history = {start}, []
-    for _ in range(nsteps):
-        reachable = set()
+def reachable_blocks(nsteps, grid):
+    # tile the garden infinitely, or rather, as far as we can walk
+    gardens = grid.array != ord(ROCK)
+    ty, tx = nsteps // grid.height + 1, nsteps // grid.width + 1
+    gardens = np.tile(gardens, (2 * ty + 1, 2 * tx + 1))
 
-        while fringe:
-            cell = fringe.pop()
-            for succ in successors(cell, rocks, bounds):
-                reachable.add(succ)
+    sx, sy = grid.coords(int(grid.find(START)[0]))
+    sx, sy = sx + tx * grid.width, sy + ty * grid.height
 
-        fringe = reachable
-        history.append(len(fringe))
+    fringe, history = np.zeros_like(gardens), []
+    fringe[sy, sx] = True
 
-    return history
+    for _ in range(nsteps):
+        # step into every direction at once
+        reachable = np.zeros_like(fringe)
+        reachable[1:, :] |= fringe[:-1, :]
+        reachable[:-1, :] |= fringe[1:, :]
+        reachable[:, 1:] |= fringe[:, :-1]
+        reachable[:, :-1] |= fringe[:, 1:]
 
+        fringe = reachable & gardens
+        history.append(int(np.count_nonzero(fringe)))
 
-def successors(pos, rocks, bounds):
-    for delta in (1, -1, 1j, -1j):
-        nxt = pos + delta
-        infnxt = complex(nxt.real % bounds[1], nxt.imag % bounds[0])
-        if infnxt not in rocks:
-            yield nxt
+    return history
 
 
 def load(data):
-    lines = data.split("\n")
-
-    bounds = len(lines), len(lines[0])
-    rocks, start = set(), None
-
-    for y, line in enumerate(lines):
-        for x, cell in enumerate(line):
-            if cell == ROCK:
-                rocks.add(x + y * 1j)
-            elif cell == START:
-                start = x + y * 1j
-
-    return rocks, bounds, start
+    return Grid.from_bytes(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=21)
+    data = read_input(21)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 3751
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 619407349431167
-    puzzle.answer_b = ans2
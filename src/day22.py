@@ -3,24 +3,22 @@
 
 from collections import defaultdict
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
+from inputs import read_input
+from instrument import instrument
+from tokenizer import integers
 
 X, Y, Z = 0, 1, 2
 STA, END = 0, 1
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(bricks):
     is_supported_by, _ = simulate_gravity(bricks)
     essential_bricks = essential_brick_indexes(is_supported_by)
     return len(bricks) - len(essential_bricks)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(bricks):
     is_supported_by, does_support = simulate_gravity(bricks)
     essential_bricks = essential_brick_indexes(is_supported_by)
@@ -106,22 +104,20 @@ def num_supported_bricks(base_index, is_supported_by, does_support):
 
 
 def load(data):
-    bricks = []
-    for line in data.split("\n"):
-        ax, ay, az, bx, by, bz = parse("{:d},{:d},{:d}~{:d},{:d},{:d}", line)
-        assert ax <= bx and ay <= by and az <= bz
-        bricks.append(((ax, ay, az), (bx, by, bz)))
+    # the start and end coordinates of all bricks at once
+    bricks = integers(data, columns=6).reshape(-1, 2, 3)
+    assert (bricks[:, STA] <= bricks[:, END]).all()
+
+    bricks = [(tuple(sta), tuple(end)) for sta, end in bricks.tolist()]
 
     return bricks
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=22)
+    data = read_input(22)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 443
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 69915
-    puzzle.answer_b = ans2
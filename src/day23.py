@@ -1,30 +1,29 @@
 # Advent of Code 2023, Day 23
 # (c) blu3r4y
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import Grid
+from inputs import read_input
+from instrument import counters, instrument
+from lazy import lazy_import
 
-PATH, FOREST, UP, RIGHT, DOWN, LEFT = ".", "#", "^", ">", "v", "<"
-SLOPES = {UP: (0, -1), RIGHT: (1, 0), DOWN: (0, 1), LEFT: (-1, 0)}
-DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+nx = lazy_import("networkx")
 
+PATH, FOREST, UP, RIGHT, DOWN, LEFT = map(ord, ".#^>v<")
 
-@print_calls
-@print_durations(unit="ms")
+
+@instrument
 def part1(data):
     return solve(data, with_slopes=True)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(data):
     return solve(data, with_slopes=False)
 
 
-def solve(data, with_slopes):
-    grid, xmax, ymax = data
-    start, end = (1, 0), (xmax - 1, ymax)
+def solve(grid, with_slopes):
+    start = grid.index(1, 0)
+    end = grid.index(grid.width - 2, grid.height - 1)
 
     G = parse_graph(grid, with_slopes)
     G = compress_graph(G)
@@ -32,12 +31,21 @@ def solve(data, with_slopes):
 
 
 def parse_graph(grid, with_slopes):
+    # the slopes point into one of the directions of the grid, clockwise
+    right, down, left, up = grid.directions
+    slopes = {UP: (up,), RIGHT: (right,), DOWN: (down,), LEFT: (left,)}
+
+    cells = grid.cells.tobytes()
+
     G = nx.DiGraph()
-    for xy in grid:
-        if grid[xy] == FOREST:
+    for pos, cell in enumerate(cells):
+        if cell == FOREST:
             continue
-        for succ in successors(grid, xy, with_slopes):
-            G.add_edge(xy, succ)
+
+        deltas = slopes.get(cell, grid.directions) if with_slopes else grid.directions
+        for delta in deltas:
+            if cells[pos + delta] != FOREST:
+                G.add_edge(pos, pos + delta)
 
     return G
 
@@ -65,42 +73,29 @@ def compress_graph(G):
 
 
 def longest_path_length(graph, start, end):
+    count = counters("day23.longest_path_length")
+
     longest_path = 0
     for edges in nx.all_simple_edge_paths(graph, start, end):
+        if count is not None:
+            count["paths"] += 1
+
         path_weight = sum(graph[u][v].get("weight", 1) for u, v in edges)
         longest_path = max(path_weight, longest_path)
 
     return longest_path
 
 
-def successors(grid, xy, with_slopes):
-    x, y = xy
-    dxy = [SLOPES[grid[xy]]] if with_slopes and grid[xy] in SLOPES else DIRECTIONS
-    for dx, dy in dxy:
-        nxy = x + dx, y + dy
-        if nxy in grid and grid[nxy] != FOREST:
-            yield nxy
-
-
 def load(data):
-    grid = {}
-    xmax, ymax = 0, 0
-    for y, row in enumerate(data.split("\n")):
-        ymax = max(ymax, y)
-        for x, cell in enumerate(row):
-            grid[(x, y)] = cell
-            xmax = max(xmax, x)
-
-    return grid, xmax, ymax
+    # the padding is forest as well, so that nobody walks off the map
+    return Grid.from_bytes(data, fill=FOREST)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=23)
+    data = read_input(23)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 2190
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 6258
-    puzzle.answer_b = ans2
@@ -3,13 +3,13 @@
 
 from itertools import combinations
 
-from aocd.models import Puzzle
-from funcy import collecting, print_calls, print_durations
-from sympy import ZZ, Symbol, solve
+from funcy import collecting
 
+from inputs import read_input
+from instrument import instrument
 
-@print_calls
-@print_durations(unit="ms")
+
+@instrument
 def part1(traces, test_area=(200000000000000, 400000000000000)):
     lo, hi = test_area
     collisions = 0
@@ -35,8 +35,7 @@ def part1(traces, test_area=(200000000000000, 400000000000000)):
     return collisions
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(traces, sample_size=3, check=False):
     # overall, we only have 6 unknowns (3x rock position, 3x rock velocity)
     # plus one unknown for every trace (the time of collision), while every
@@ -72,6 +71,8 @@ def intersection(x1, y1, x2, y2, x3, y3, x4, y4):
 
 
 def solve_equations(traces):
+    from sympy import ZZ, Symbol, solve
+
     # rock position and velocity
     rx, ry, rz = (Symbol(x, domain=ZZ) for x in ("rx", "ry", "rz"))
     rvx, rvy, rvz = (Symbol(x, domain=ZZ) for x in ("rvx", "rvy", "rvz"))
@@ -102,12 +103,10 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=24)
+    data = read_input(24)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 25810
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 652666650475950
-    puzzle.answer_b = ans2
@@ -1,13 +1,15 @@
 # Advent of Code 2023, Day 25
 # (c) blu3r4y
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
 
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
 
-@print_calls
-@print_durations(unit="ms")
+nx = lazy_import("networkx")
+
+
+@instrument
 def part1(G):
     # find the minimum edge cut and remove those edges
     cutset = nx.minimum_edge_cut(G)
@@ -28,8 +30,7 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=25)
+    data = read_input(25)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 538560
-    puzzle.answer_a = ans1
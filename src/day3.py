@@ -1,108 +1,151 @@
 # Advent of Code 2023, Day 3
 # (c) blu3r4y
 
-from collections import defaultdict
-from functools import reduce
-from operator import mul
+import re
+from bisect import bisect_left
+from collections import deque
+from itertools import chain
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import PADDING, Grid
+from inputs import read_input, split_lines
+from instrument import instrument
+from lazy import lazy_import
 
+np = lazy_import("numpy")
 
-@print_calls
-@print_durations(unit="ms")
-def part1(grid):
-    numbers, symbols, _ = grid
-    total = 0
+EMPTY, GEAR = ".", "*"
 
-    for y, xrange in numbers.items():
-        for (xstart, xend), cell in xrange.items():
-            is_part_number = False
+NUMBER = re.compile(r"[0-9]+")
+SYMBOL = re.compile(r"[^0-9.]")
 
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    if dy == 0 and dx == 0:
-                        continue
 
-                    # check if the adjacent cell is a symbol
-                    for x in range(xstart, xend + 1):
-                        if (y + dy, x + dx) in symbols:
-                            is_part_number = True
+@instrument
+def part1(data):
+    grid, labels, values = data
 
-            if is_part_number:
-                total += cell
+    # grow the symbols by one cell in every direction, so that the numbers
+    # that intersect them are exactly the ones with an adjacent symbol
+    symbols = symbol_mask(grid)
+    adjacent = symbols.copy()
+    for d in grid.around:
+        adjacent |= np.roll(symbols, d)
 
-    return total
+    touched = np.bincount(labels[adjacent], minlength=len(values)) > 0
+    touched[0] = False
 
+    return int(values[touched].sum())
 
-@print_calls
-@print_durations(unit="ms")
-def part2(grid):
-    numbers, _, gears = grid
-    total = 0
 
-    for gy, gx in gears:
-        adjacents = set()
+@instrument
+def part2(data):
+    grid, labels, values = data
 
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dy == 0 and dx == 0:
-                    continue
+    # the labels around every gear, straight from the index, one gear per row
+    gears = grid.find(GEAR)
+    around = labels[gears[:, np.newaxis] + np.array(grid.around)]
 
-                # check the ranges of the adjacent numbers
-                x, y = gx + dx, gy + dy
-                for (nxstart, nxend), cell in numbers[y].items():
-                    if nxstart <= x <= nxend:
-                        adjacents.add(cell)
+    # the distinct values of the adjacent numbers, with -1 for no number
+    adjacent = np.sort(np.where(around > 0, values[around], -1), axis=1)
+    distinct = adjacent >= 0
+    distinct[:, 1:] &= adjacent[:, 1:] != adjacent[:, :-1]
 
-        if len(adjacents) == 2:
-            total += reduce(mul, adjacents)
+    ratios = np.where(distinct, adjacent, 1).prod(axis=1)
+    return int(ratios[distinct.sum(axis=1) == 2].sum())
 
-    return total
 
+def touching(data, x, y):
+    # the numbers that cover the cell or any of its neighbours, in reading order
+    grid, labels, values = data
+    pos = grid.index(x, y)
 
-def load(data):
-    numbers, symbols, gears = defaultdict(dict), set(), set()
-
-    for y, line in enumerate(data.split("\n")):
-        x, xstart, buffer = 0, None, ""
-        while x < len(line):
-            cell = line[x]
-            if cell.isnumeric():
-                # handle starting point of a number
-                # and incrementally buffer the number
-                if buffer == "":
-                    xstart = x
-                buffer += cell
-
-            else:
-                if buffer:
-                    # store the number and reset the buffer
-                    numbers[y][(xstart, x - 1)] = int(buffer)
-                    xstart, buffer = None, ""
-
-                if cell != ".":
-                    # store symbols
-                    symbols.add((y, x))
-                    if cell == "*":
-                        gears.add((y, x))
-
-            x += 1
-
-        if buffer:
-            # handle numbers at the end of the line
-            numbers[y][(xstart, x - 1)] = int(buffer)
+    ids = {labels[pos + d] for d in (0, *grid.around)}
+    return [int(values[i]) for i in sorted(ids) if i]
+
+
+def streaming(data):
+    # both answers in constant memory, for schematics of any height
+    total1 = total2 = 0
+    for parts, ratios in row_contributions(data):
+        total1 += parts
+        total2 += ratios
+
+    return total1, total2
+
+
+def row_contributions(data):
+    # the sum of the part numbers and gear ratios of each row, which is settled
+    # as soon as the row below is read, so that only three rows are kept
+    window = deque([([], [], [])], maxlen=3)
+
+    # one more empty row at the end settles the last one
+    for line in chain(split_lines(data), [""]):
+        window.append(parse_row(line))
+        if len(window) < 3:
+            continue
 
+        numbers, _, gears = window[1]
+
+        parts = 0
+        for start, end, number in numbers:
+            if any(has_symbol(symbols, start - 1, end) for _, symbols, _ in window):
+                parts += number
+
+        ratios = 0
+        for x in gears:
+            ratio = {n for row, _, _ in window for s, e, n in row if s - 1 <= x <= e}
+            if len(ratio) == 2:
+                ratios += ratio.pop() * ratio.pop()
+
+        yield parts, ratios
+
+
+def parse_row(line):
+    numbers = [(m.start(), m.end(), int(m[0])) for m in NUMBER.finditer(line)]
+    symbols = [m.start() for m in SYMBOL.finditer(line)]
+    gears = [x for x in symbols if line[x] == GEAR]
     return numbers, symbols, gears
 
 
+def has_symbol(symbols, lo, hi):
+    # the symbols of a row are sorted by their position
+    i = bisect_left(symbols, lo)
+    return i < len(symbols) and symbols[i] <= hi
+
+
+def symbol_mask(grid):
+    cells = grid.cells
+    return ~digit_mask(cells) & (cells != ord(EMPTY)) & (cells != PADDING)
+
+
+def digit_mask(cells):
+    # anything below zero wraps around and ends up above nine as well
+    return cells - np.uint8(ord("0")) < 10
+
+
+def load(data):
+    grid = Grid.from_bytes(data)
+
+    # label the runs of digits with consecutive ids, starting at one, where
+    # the padding separates the rows, so that numbers never wrap around
+    digits = digit_mask(grid.cells)
+    starts = digits.copy()
+    starts[1:] &= ~digits[:-1]
+    labels = np.cumsum(starts, dtype=np.int32) * digits
+
+    # the values of the numbers by their label, with a zero for no number
+    numbers = re.findall(rb"\d+", grid.cells.tobytes())
+    values = np.array([0, *map(int, numbers)], dtype=np.int64)
+
+    return grid, labels, values
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=3)
+    data = read_input(3)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 543867
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 79613331
-    puzzle.answer_b = ans2
+
+    assert streaming(data) == (ans1, ans2)
@@ -1,57 +1,138 @@
 # Advent of Code 2023, Day 4
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
+import re
 
+from inputs import read_input
+from instrument import instrument
+from lazy import lazy_import
+from tokenizer import scan
 
-@print_calls
-@print_durations(unit="ms")
+np = lazy_import("numpy")
+
+NUMBER = re.compile(rb"\d+")
+
+
+@instrument
 def part1(deck):
     total = 0
-
-    for win, my in deck.values():
-        matches = win.intersection(my)
-        if len(matches) > 0:
-            total += 2 ** (len(matches) - 1)
+    for _, win, my in deck:
+        total += (1 << (win & my).bit_count()) >> 1
 
     return total
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(deck):
-    hand = {k: 1 for k in deck.keys()}
+    return total_cards((win & my).bit_count() for _, win, my in deck)
+
+
+def total_cards(matches):
+    # every card wins one copy of each of the next cards, which is added at the
+    # start of that range and subtracted after its end, like a difference array
+    copies = total = 0
+
+    # the pending changes never reach further than the most matches so far,
+    # so they are kept in a ring buffer, which only grows with the matches
+    changes = [0]
+
+    for i, m in enumerate(matches):
+        if m >= len(changes):
+            changes = grow(changes, i, m + 1)
+
+        size = len(changes)
+        copies += changes[i % size]
+        changes[i % size] = 0
+
+        count = 1 + copies
+        total += count
+
+        changes[(i + 1) % size] += count
+        changes[(i + 1 + m) % size] -= count
+
+    return total
+
+
+def grow(changes, start, size):
+    # the pending changes of the cards from the start on stay where they belong
+    ring = [0] * size
+    for i in range(start, start + len(changes)):
+        ring[i % size] = changes[i % len(changes)]
+
+    return ring
 
-    for card in sorted(deck.keys()):
-        win, my = deck[card]
-        matches = win.intersection(my)
-        for c in range(card + 1, card + len(matches) + 1):
-            hand[c] += hand[card]
 
-    return sum(hand.values())
+def solve_batch(data):
+    # both answers for decks of millions of cards, parsed and matched at once
+    matches = match_counts(data)
+    points = (1 << matches) >> 1
+
+    return int(points.sum()), total_cards(matches.tolist())
+
+
+def match_counts(data):
+    if isinstance(data, str):
+        data = data.encode()
+
+    # all cards share the layout of the first one after the card id, with
+    # right-aligned numbers, at the same offsets from the end of every line
+    data = bytes(data).rstrip(b"\r\n")
+    array = np.frombuffer(data, dtype=np.uint8)
+    ends = np.append(np.flatnonzero(array == ord("\n")), len(array))
+    ends -= array[ends - 1] == ord("\r")
+
+    head = data[: ends[0]]
+    colon, bar = head.index(b":"), head.index(b"|")
+    offsets = np.array([m.end() for m in NUMBER.finditer(head, colon)])
+    offsets -= len(head)
+
+    # the two digits of each number, where spaces count as zeros
+    digits = np.where(array == ord(" "), 0, array - np.uint8(ord("0")))
+    positions = ends[:, np.newaxis] + offsets
+    assert (array[positions - 3] == ord(" ")).all(), "numbers must be below 100"
+
+    numbers = 10 * digits[positions - 2] + digits[positions - 1]
+
+    nwin = np.count_nonzero(offsets + len(head) < bar)
+    win, my = numbers[:, :nwin], numbers[:, nwin:]
+
+    both = (bitmask(win) & bitmask(my)).view(np.uint8)
+    return popcount_table()[both].sum(axis=1, dtype=np.int64)
+
+
+def bitmask(numbers):
+    # the numbers of each row as bits of a 128-bit mask, in two words
+    bits = np.left_shift(np.uint64(1), (numbers % 64).astype(np.uint64))
+    words = [np.where(numbers // 64 == w, bits, 0) for w in (0, 1)]
+    return np.stack([np.bitwise_or.reduce(w, axis=1) for w in words], axis=1)
+
+
+def popcount_table():
+    return np.array([i.bit_count() for i in range(256)], dtype=np.uint8)
 
 
 def load(data):
-    deck = {}
+    # numbers are below 100, so a card fits into two integers as bitmasks
+    for match in scan(data, r"Card +(\d+):([\d ]+)\|([\d ]+)"):
+        card, win, my = match.groups()
+        yield int(card), to_bitmask(win), to_bitmask(my)
+
 
-    for line in data.split("\n"):
-        card, win, my = parse("Card {:d>}: {} | {}", line).fixed
-        win = set(map(int, win.split()))
-        my = set(map(int, my.split()))
-        deck[int(card)] = win, my
+def to_bitmask(numbers):
+    mask = 0
+    for n in numbers.split():
+        mask |= 1 << int(n)
 
-    return deck
+    return mask
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=4)
+    data = read_input(4)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 27454
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 6857330
-    puzzle.answer_b = ans2
+
+    assert solve_batch(data) == (ans1, ans2)
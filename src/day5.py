@@ -1,13 +1,14 @@
 # Advent of Code 2023, Day 5
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import chunks, lmap, print_calls, print_durations
-from parse import parse
+from funcy import chunks, lmap
 
+from inputs import read_input
+from instrument import instrument
+from tokenizer import integers
 
-@print_calls
-@print_durations(unit="ms")
+
+@instrument
 def part1(maps):
     seeds, stages = maps
 
@@ -23,8 +24,7 @@ def part1(maps):
     return smallest
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(maps):
     seeds, stages = maps
 
@@ -99,24 +99,21 @@ def range_overlap(a, asize, b, bsize):
 
 def load(data):
     blocks = data.split("\n\n")
-    seeds = lmap(int, parse("seeds: {}", blocks[0]).fixed[0].split())
+    seeds = integers(blocks[0]).tolist()
 
     stages = []
     for block in blocks[1:]:
-        blocklines = block.splitlines()[1:]
-        stage = [tuple(map(int, line.split())) for line in blocklines]
-        stages.append(stage)
+        _, ranges = block.split("\n", 1)
+        stages.append(lmap(tuple, integers(ranges, columns=3).tolist()))
 
     return seeds, stages
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=5)
+    data = read_input(5)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 3374647
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 6082852
-    puzzle.answer_b = ans2
@@ -3,13 +3,12 @@
 
 from math import ceil, floor, sqrt
 
-from aocd.models import Puzzle
-from funcy import lmap, print_calls, print_durations
-from parse import parse
+from inputs import read_input
+from instrument import instrument
+from tokenizer import integers
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(data):
     times, dists = data
 
@@ -20,8 +19,7 @@ def part1(data):
     return product
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(data):
     times, dists = data
     t = int("".join(map(str, times)))
@@ -40,20 +38,16 @@ def compute_number_of_ways(t, d):
 
 
 def load(data):
-    times, dists = data.split("\n")
-    times = lmap(int, parse("Time: {}", times)[0].split())
-    dists = lmap(int, parse("Distance: {}", dists)[0].split())
+    times, dists = integers(data).reshape(2, -1).tolist()
 
     return times, dists
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=6)
+    data = read_input(6)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 2374848
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 39132886
-    puzzle.answer_b = ans2
@@ -4,22 +4,22 @@
 from collections import Counter
 from functools import cmp_to_key, partial
 
-from aocd.models import Puzzle
-from funcy import collecting, print_calls, print_durations
+from funcy import collecting
+
+from inputs import read_input
+from instrument import instrument
 
 # map card ranks to pure integers
 RANKS_PART1 = "23456789TJQKA"
 RANKS_PART2 = "J23456789TQKA"
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(hands):
     return total_winnings(hands, cmp_func=hand_strength)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(hands):
     return total_winnings(hands, cmp_func=hand_strength_with_joker)
 
@@ -132,12 +132,10 @@ def load(data, ranks):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=7)
+    data = read_input(7)
 
-    ans1 = part1(load(puzzle.input_data, RANKS_PART1))
+    ans1 = part1(load(data, RANKS_PART1))
     assert ans1 == 246424613
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data, RANKS_PART2))
+    ans2 = part2(load(data, RANKS_PART2))
     assert ans2 == 248256639
-    puzzle.answer_b = ans2
@@ -4,20 +4,18 @@
 import math
 from collections import defaultdict
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
+from inputs import read_input
+from instrument import instrument
+from tokenizer import records
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part1(data):
     ins, graph = data
     return number_of_steps(ins, graph, "AAA", "ZZZ")
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(data):
     ins, graph = data
 
@@ -64,21 +62,17 @@ def load(data):
     ins_encoder = {"L": 0, "R": 1}
     ins = tuple(ins_encoder[i] for i in ins)
 
-    graph = {}
-    for line in nodes.splitlines():
-        node, left, right = parse("{:w} = ({:w}, {:w})", line).fixed
-        graph[node] = (left, right)
+    names, lefts, rights = records(nodes, r"(\w+) = \((\w+), (\w+)\)")
+    graph = dict(zip(names, zip(lefts, rights)))
 
     return ins, graph
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=8)
+    data = read_input(8)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 16409
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 11795205644011
-    puzzle.answer_b = ans2
@@ -1,19 +1,21 @@
 # Advent of Code 2023, Day 9
 # (c) blu3r4y
 
-import numpy as np
-from aocd.models import Puzzle
-from funcy import collecting, lmap, print_calls, print_durations
+from funcy import lmap
 
+from inputs import read_input, split_lines
+from instrument import instrument
+from lazy import lazy_import
 
-@print_calls
-@print_durations(unit="ms")
+np = lazy_import("numpy")
+
+
+@instrument
 def part1(histories):
     return sum_predictions(histories)
 
 
-@print_calls
-@print_durations(unit="ms")
+@instrument
 def part2(histories):
     return sum_predictions(histories, invert=True)
 
@@ -36,19 +38,16 @@ def extrapolate(numbers):
     return numbers[-1] + offset
 
 
-@collecting
 def load(data):
-    for line in data.split("\n"):
+    for line in split_lines(data):
         yield lmap(int, line.split(" "))
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2023, day=9)
+    data = read_input(9)
 
-    ans1 = part1(load(puzzle.input_data))
+    ans1 = part1(load(data))
     assert ans1 == 1974913025
-    puzzle.answer_a = ans1
 
-    ans2 = part2(load(puzzle.input_data))
+    ans2 = part2(load(data))
     assert ans2 == 884
-    puzzle.answer_b = ans2
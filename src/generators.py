@@ -0,0 +1,550 @@
+# Advent of Code 2023, Input Generators
+# (c) blu3r4y
+
+import argparse
+import random
+from string import ascii_lowercase, ascii_uppercase, digits
+
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+CARD_RANKS = "23456789TJQKA"
+PIPES = {
+    frozenset({(0, -1), (0, 1)}): "|",
+    frozenset({(-1, 0), (1, 0)}): "-",
+    frozenset({(0, -1), (1, 0)}): "L",
+    frozenset({(0, -1), (-1, 0)}): "J",
+    frozenset({(0, 1), (-1, 0)}): "7",
+    frozenset({(0, 1), (1, 0)}): "F",
+}
+
+
+def generate(day, size, seed=0):
+    func, _, _ = GENERATORS[day]
+    return func(size, random.Random(seed))
+
+
+def day1(size, rng):
+    lines = []
+    for _ in range(size):
+        tokens = [
+            rng.choice((rng.choice(ascii_lowercase), rng.choice(DIGIT_WORDS)))
+            for _ in range(rng.randint(2, 8))
+        ]
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(digits[1:]))
+        lines.append("".join(tokens))
+
+    return "\n".join(lines)
+
+
+def day2(size, rng):
+    lines = []
+    for game in range(1, size + 1):
+        cubesets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            cubesets.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game}: {'; '.join(cubesets)}")
+
+    return "\n".join(lines)
+
+
+def day3(size, rng, width=140):
+    lines = []
+    for _ in range(size):
+        line = ""
+        while len(line) < width:
+            r = rng.random()
+            if r < 0.15:
+                line += str(rng.randint(1, 999)) + "."
+            elif r < 0.2:
+                line += rng.choice("*#+$/@=%-&")
+            else:
+                line += "."
+        lines.append(line[:width])
+
+    return "\n".join(lines)
+
+
+def day4(size, rng):
+    lines = []
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+
+        # keep the number of matches low, otherwise the number of copies explodes,
+        # and never let a card win copies of cards past the end of the table
+        matches = min(rng.choice((0, 0, 0, 0, 1, 1, 2, 3)), size - card)
+        others = [n for n in range(1, 100) if n not in winning]
+        mine = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(mine)
+
+        win = " ".join(f"{n:>2}" for n in winning)
+        my = " ".join(f"{n:>2}" for n in mine)
+        lines.append(f"Card {card:>3}: {win} | {my}")
+
+    return "\n".join(lines)
+
+
+def day5(size, rng, stages=7, limit=2**32):
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(limit // 2)
+        seeds.extend([start, rng.randint(1, limit // 100)])
+
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for stage in range(stages):
+        # disjoint source ranges, mapped to random destinations
+        cuts = sorted(rng.sample(range(limit), 2 * size))
+        lines = [f"stage{stage}-to-stage{stage + 1} map:"]
+        for src, end in zip(cuts[::2], cuts[1::2]):
+            length = end - src
+            lines.append(f"{rng.randrange(limit - length)} {src} {length}")
+        blocks.append("\n".join(lines))
+
+    return "\n\n".join(blocks)
+
+
+def day6(size, rng):
+    times = [rng.randint(30, 99) for _ in range(size)]
+    dists = [rng.randint(t, t * t // 4 - 1) for t in times]
+
+    return "\n".join(
+        [
+            "Time:      " + " ".join(f"{t:>4}" for t in times),
+            "Distance:  " + " ".join(f"{d:>4}" for d in dists),
+        ]
+    )
+
+
+def day7(size, rng):
+    lines = []
+    for _ in range(size):
+        cards = "".join(rng.choice(CARD_RANKS) for _ in range(5))
+        lines.append(f"{cards} {rng.randint(1, 1000)}")
+
+    return "\n".join(lines)
+
+
+def day8(size, rng, ghosts=6):
+    ins = "".join(rng.choice("LR") for _ in range(rng.randint(50, 300)))
+    names = unique_names(rng, size, ascii_uppercase[1:-1] + digits)
+    prefixes = unique_names(rng, ghosts, ascii_uppercase[1:-1] + digits, length=(2, 2))
+
+    # every ghost walks a cycle of its own length, from its start to its end and
+    # back to the start's successor, like in the actual inputs, so that the lcm
+    # of part 2 is not trivial; left and right lead to the same node on the cycle
+    longest = max(2, size // ghosts - 1)
+    candidates = range(max(2, longest // 2), longest + 1)
+    if len(candidates) >= ghosts:
+        lengths = rng.sample(candidates, ghosts)
+    else:
+        lengths = [rng.choice(candidates) for _ in range(ghosts)]
+
+    nodes = []
+    for g, length in enumerate(lengths):
+        start = "AAA" if g == 0 else prefixes[g] + "A"
+        end = "ZZZ" if g == 0 else start[:2] + "Z"
+        cycle = [names.pop() for _ in range(length - 1)]
+
+        path = [start] + cycle + [end]
+        for a, b in zip(path, path[1:]):
+            nodes.append(f"{a} = ({b}, {b})")
+        nodes.append(f"{end} = ({cycle[0]}, {cycle[0]})")
+
+    rng.shuffle(nodes)
+    return ins + "\n\n" + "\n".join(nodes)
+
+
+def day9(size, rng, length=21):
+    lines = []
+    for _ in range(size):
+        coeffs = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        offset = rng.randint(-10, 10)
+        values = [
+            sum(c * (x + offset) ** k for k, c in enumerate(coeffs))
+            for x in range(length)
+        ]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines)
+
+
+def day10(size, rng, padding=2):
+    height, width = max(4, size), max(3, size)
+
+    # a closed loop around an x-monotone region, whose top and bottom edges
+    # wander randomly in the upper and lower half, so that it encloses tiles
+    tops = random_walk(rng, width, 0, height // 2 - 1)
+    bottoms = random_walk(rng, width, height // 2 + 1, height - 1)
+
+    # clockwise from the top left corner, where the outer columns are straight
+    path = [(0, tops[0])]
+    for x in range(1, width - 1):
+        path.extend(vertical(x, tops[x - 1], tops[x]))
+    path.extend(vertical(width - 1, tops[-2], bottoms[-1]))
+    for x in range(width - 2, 0, -1):
+        path.extend(vertical(x, bottoms[x + 1], bottoms[x]))
+    path.extend(vertical(0, bottoms[1], tops[0])[:-1])
+
+    grid = [
+        [rng.choice("|-LJ7F.") for _ in range(width + 2 * padding)]
+        for _ in range(height + 2 * padding)
+    ]
+    for i, (x, y) in enumerate(path):
+        (px, py), (nx, ny) = path[i - 1], path[(i + 1) % len(path)]
+        grid[y + padding][x + padding] = PIPES[
+            frozenset({(px - x, py - y), (nx - x, ny - y)})
+        ]
+
+    # the start must only connect to the loop, so clear its outer neighbors
+    sy = tops[0] + padding
+    grid[sy][padding] = "S"
+    grid[sy - 1][padding] = grid[sy][padding - 1] = "."
+
+    return "\n".join("".join(row) for row in grid)
+
+
+def day11(size, rng):
+    side = max(2, int((size * 8) ** 0.5))
+    galaxies = set(rng.sample(range(side * side), min(size, side * side)))
+
+    return "\n".join(
+        "".join("#" if y * side + x in galaxies else "." for x in range(side))
+        for y in range(side)
+    )
+
+
+def day12(size, rng):
+    lines = []
+    for _ in range(size):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 6))]
+
+        # build a valid arrangement first and then hide some of its springs
+        springs = "." * rng.randint(0, 3)
+        springs += ".".join("#" * g + "." * rng.randint(0, 2) for g in groups)
+        springs += "." * rng.randint(0, 3)
+        springs = "".join("?" if rng.random() < 0.5 else s for s in springs)
+
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+
+    return "\n".join(lines)
+
+
+def day13(size, rng):
+    blocks = []
+    for _ in range(size):
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [[rng.choice(".#") for _ in range(width)] for _ in range(height)]
+
+        # mirror every row at a random vertical axis
+        axis = rng.randint(1, width - 1)
+        for row in rows:
+            for k in range(min(axis, width - axis)):
+                row[axis + k] = row[axis - k - 1]
+
+        # transpose half of the blocks to get horizontal reflections
+        if rng.random() < 0.5:
+            rows = [list(col) for col in zip(*rows)]
+        blocks.append("\n".join("".join(row) for row in rows))
+
+    return "\n\n".join(blocks)
+
+
+def day14(size, rng):
+    return random_grid(rng, size, size, ".O#", (0.6, 0.2, 0.2))
+
+
+def day15(size, rng):
+    labels = unique_names(rng, max(1, size // 3), ascii_lowercase, length=(2, 6))
+
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+
+    return ",".join(steps)
+
+
+def day16(size, rng):
+    return random_grid(rng, size, size, ".\\/|-", (0.9, 0.025, 0.025, 0.025, 0.025))
+
+
+def day17(size, rng):
+    return random_grid(rng, size, size, "123456789")
+
+
+def day18(size, rng):
+    columns = max(1, size // 4)
+
+    # both plans describe x-monotone polygons, which never intersect themselves
+    plan1 = monotone_polygon(rng, columns, scale=10)
+    plan2 = monotone_polygon(rng, columns, scale=10000)
+
+    lines = []
+    for (action, meters), (action2, meters2) in zip(plan1, plan2):
+        color = f"{meters2:05x}{'RDLU'.index(action2)}"
+        lines.append(f"{action} {meters} (#{color})")
+
+    return "\n".join(lines)
+
+
+def day19(size, rng):
+    names = ["in"] + [
+        n
+        for n in unique_names(rng, size + 1, ascii_lowercase, length=(2, 3))
+        if n != "in"
+    ][: size - 1]
+
+    # rules only point to later workflows, so that there are no loops
+    workflows = []
+    for i, name in enumerate(names):
+        targets = names[i + 1 :] + ["A", "R"]
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            key, op = rng.choice("xmas"), rng.choice("<>")
+            rules.append(f"{key}{op}{rng.randint(2, 3999)}:{rng.choice(targets)}")
+        rules.append(rng.choice(targets))
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+
+    parts = []
+    for _ in range(size):
+        fields = ",".join(f"{k}={rng.randint(1, 4000)}" for k in "xmas")
+        parts.append(f"{{{fields}}}")
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts)
+
+
+def day20(size, rng, bits=12):
+    names = unique_names(rng, size * (bits + 2) + 2, ascii_lowercase, length=(2, 2))
+    names = iter(n for n in names if n != "rx")
+    hub = next(names)
+
+    # every chain is a binary counter of flip-flops that resets itself
+    # through a conjunction, once it reached its cycle length, like in the actual inputs
+    lines, heads = [f"&{hub} -> rx"], []
+    for _ in range(size):
+        cycle = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+        flops = [next(names) for _ in range(bits)]
+        conj, inverter = next(names), next(names)
+        heads.append(flops[0])
+
+        for i, flop in enumerate(flops):
+            outputs = [flops[i + 1]] if i + 1 < bits else []
+            if cycle >> i & 1:
+                outputs.append(conj)
+            lines.append(f"%{flop} -> {', '.join(outputs)}")
+
+        resets = [flops[0]] + [f for i, f in enumerate(flops) if not cycle >> i & 1]
+        lines.append(f"&{conj} -> {', '.join(resets + [inverter])}")
+        lines.append(f"&{inverter} -> {hub}")
+
+    lines.append(f"broadcaster -> {', '.join(heads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day21(size, rng):
+    # the second part expects an odd square grid, the start in the center,
+    # and an empty border and empty center row and column
+    side = size if size % 2 else size + 1
+    center = side // 2
+
+    grid = [[rng.choice("...#") for _ in range(side)] for _ in range(side)]
+    for i in range(side):
+        for a, b in ((0, i), (side - 1, i), (center, i)):
+            grid[a][b] = grid[b][a] = "."
+    grid[center][center] = "S"
+
+    return "\n".join("".join(row) for row in grid)
+
+
+def day22(size, rng, area=10):
+    lines, top = [], 0
+    for _ in range(size):
+        length, axis = rng.randint(1, 4), rng.randrange(3)
+        start = [rng.randrange(area), rng.randrange(area), top + rng.randint(1, 3)]
+        end = start.copy()
+        end[axis] += length - 1
+        end[0], end[1] = min(end[0], area - 1), min(end[1], area - 1)
+
+        # stack the bricks above each other, so that they never overlap
+        top = end[2]
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day23(size, rng, spacing=8):
+    # a lattice of junctions, connected by corridors with slopes that
+    # point right and down, like in the actual inputs; the number of
+    # paths grows exponentially with the size, so keep it small
+    junctions = max(2, size)
+    side = 3 + (junctions - 1) * spacing
+    grid = [["#"] * side for _ in range(side)]
+
+    for i in range(junctions):
+        for j in range(junctions):
+            x, y = 1 + j * spacing, 1 + i * spacing
+            grid[y][x] = "."
+            if j + 1 < junctions and (i in (0, junctions - 1) or rng.random() < 0.9):
+                for dx in range(1, spacing):
+                    grid[y][x + dx] = ">" if dx in (1, spacing - 1) else "."
+            if i + 1 < junctions and (j in (0, junctions - 1) or rng.random() < 0.9):
+                for dy in range(1, spacing):
+                    grid[y + dy][x] = "v" if dy in (1, spacing - 1) else "."
+
+    grid[0][1] = grid[side - 1][side - 2] = "."
+    return "\n".join("".join(row) for row in grid)
+
+
+def day24(size, rng):
+    # let every hailstone collide with the same rock at some distinct time
+    rock = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [rng.randint(-100, 100) for _ in range(3)]
+    times = rng.sample(range(10**11, 10**12), size)
+
+    lines = []
+    for t in times:
+        velocity = [0]
+        while 0 in velocity:
+            velocity = [
+                v + rng.choice((-1, 1)) * rng.randint(1, 300) for v in rock_velocity
+            ]
+        position = [r + t * (rv - v) for r, rv, v in zip(rock, rock_velocity, velocity)]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+
+    return "\n".join(lines)
+
+
+def day25(size, rng, chords=2):
+    names = unique_names(rng, max(16, size), ascii_lowercase, length=(3, 3))
+    half = len(names) // 2
+
+    # two 4-edge-connected components, joined by exactly three edges
+    edges = set()
+    for component in (names[:half], names[half:]):
+        n = len(component)
+        for i in range(n):
+            edges.add((component[i], component[(i + 1) % n]))
+            edges.add((component[i], component[(i + 2) % n]))
+            for _ in range(rng.randint(0, chords)):
+                edges.add((component[i], rng.choice(component)))
+
+    for a, b in zip(rng.sample(names[:half], 3), rng.sample(names[half:], 3)):
+        edges.add((a, b))
+
+    wiring = {}
+    for a, b in sorted(edges):
+        if a != b and b not in wiring.get(a, ()) and a not in wiring.get(b, ()):
+            wiring.setdefault(a, []).append(b)
+
+    return "\n".join(f"{a}: {' '.join(bs)}" for a, bs in wiring.items())
+
+
+def random_grid(rng, height, width, symbols, weights=None):
+    rows = ["".join(rng.choices(symbols, weights, k=width)) for _ in range(height)]
+    return "\n".join(rows)
+
+
+def unique_names(rng, count, alphabet, length=(3, 3)):
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choice(alphabet) for _ in range(rng.randint(*length))))
+
+    # sets are ordered by hashes, which differ between interpreter runs
+    names = sorted(names)
+    rng.shuffle(names)
+    return names
+
+
+def monotone_polygon(rng, columns, scale):
+    # the top edge stays above the bottom edge in every column
+    tops = [rng.randint(6 * scale, 11 * scale) for _ in range(columns)]
+    bottoms = [rng.randint(0, 5 * scale) for _ in range(columns)]
+    tops, bottoms = distinct_neighbors(rng, tops), distinct_neighbors(rng, bottoms)
+    widths = [rng.randint(1, 2 * scale) for _ in range(columns)]
+
+    plan = [("U", tops[0] - bottoms[0])]
+    for i in range(columns):
+        plan.append(("R", widths[i]))
+        if i + 1 < columns:
+            delta = tops[i + 1] - tops[i]
+            plan.append(("U" if delta > 0 else "D", abs(delta)))
+
+    plan.append(("D", tops[-1] - bottoms[-1]))
+    for i in reversed(range(columns)):
+        plan.append(("L", widths[i]))
+        if i > 0:
+            delta = bottoms[i - 1] - bottoms[i]
+            plan.append(("U" if delta > 0 else "D", abs(delta)))
+
+    return plan
+
+
+def random_walk(rng, length, low, high, step=2):
+    values = [rng.randint(low, high)]
+    for _ in range(length - 1):
+        values.append(min(high, max(low, values[-1] + rng.randint(-step, step))))
+
+    return values
+
+
+def vertical(x, y1, y2):
+    # the cells of a column from one row to another, both included
+    step = 1 if y2 >= y1 else -1
+    return [(x, y) for y in range(y1, y2 + step, step)]
+
+
+def distinct_neighbors(rng, values):
+    # avoid moves of length zero between two columns
+    for i in range(1, len(values)):
+        while values[i] == values[i - 1]:
+            values[i] += rng.choice((-1, 1))
+
+    return values
+
+
+# generator, base size, and what the size is measured in
+GENERATORS = {
+    1: (day1, 1000, "lines"),
+    2: (day2, 100, "games"),
+    3: (day3, 140, "rows"),
+    4: (day4, 200, "cards"),
+    5: (day5, 40, "ranges per map"),
+    6: (day6, 4, "races"),
+    7: (day7, 1000, "hands"),
+    8: (day8, 700, "nodes"),
+    9: (day9, 200, "histories"),
+    10: (day10, 140, "grid side"),
+    11: (day11, 400, "galaxies"),
+    12: (day12, 1000, "rows"),
+    13: (day13, 100, "patterns"),
+    14: (day14, 100, "grid side"),
+    15: (day15, 4000, "steps"),
+    16: (day16, 110, "grid side"),
+    17: (day17, 141, "grid side"),
+    18: (day18, 600, "instructions"),
+    19: (day19, 500, "workflows and parts"),
+    20: (day20, 4, "counters"),
+    21: (day21, 131, "grid side"),
+    22: (day22, 1200, "bricks"),
+    23: (day23, 3, "junctions per side"),
+    24: (day24, 300, "hailstones"),
+    25: (day25, 1500, "components"),
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input")
+    parser.add_argument("day", type=int, choices=GENERATORS.keys())
+    parser.add_argument("size", type=int, nargs="?", help="defaults to the base size")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    print(generate(args.day, args.size or GENERATORS[args.day][1], args.seed))
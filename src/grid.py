@@ -0,0 +1,66 @@
+# Advent of Code 2023, Grids
+# (c) blu3r4y
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# the value of the cells around the grid, which never occurs in the inputs
+PADDING = 0
+
+# the indices of the directions of a grid, clockwise, starting to the right
+RIGHT, DOWN, LEFT, UP = range(4)
+
+
+class Grid:
+    # the characters of a grid in a flat uint8 buffer, row by row,
+    # surrounded by a border of padding cells, so that the neighbours
+    # of every cell are valid indices and bounds checks become lookups
+
+    def __init__(self, cells, width, height, pad=1):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+
+        # offsets to the neighbours, in the order of the direction indices
+        self.directions = (1, self.stride, -1, -self.stride)
+        self.diagonals = tuple(
+            dy * self.stride + dx for dy in (-1, 1) for dx in (-1, 1)
+        )
+        self.around = self.directions + self.diagonals
+
+    @classmethod
+    def from_bytes(cls, data, pad=1, fill=PADDING):
+        if isinstance(data, str):
+            data = data.encode()
+
+        # trailing newlines are not part of the grid
+        data = bytes(data).rstrip(b"\r\n")
+
+        # all rows have the same width, so the input already is a 2d array,
+        # with the line breaks as an extra column that is cut off
+        width = data.index(b"\n") if b"\n" in data else len(data)
+        buffer = np.frombuffer(data + b"\n", dtype=np.uint8)
+        rows = buffer.reshape(-1, width + 1)[:, :width]
+
+        cells = np.pad(rows, pad, constant_values=fill)
+        return cls(cells.ravel(), width, len(rows), pad)
+
+    @property
+    def array(self):
+        # a 2d view of the cells without the padding
+        p = self.pad
+        rows = self.cells.reshape(-1, self.stride)
+        return rows[p : p + self.height, p : p + self.width]
+
+    def index(self, x, y):
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coords(self, index):
+        y, x = divmod(index, self.stride)
+        return x - self.pad, y - self.pad
+
+    def find(self, char):
+        return np.flatnonzero(self.cells == ord(char))
@@ -0,0 +1,107 @@
+# Advent of Code 2023, Import Times
+# (c) blu3r4y
+
+import argparse
+import subprocess
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+SRC = Path(__file__).parent
+
+# a single line of the -X importtime output, with times in milliseconds
+Import = namedtuple("Import", ["name", "level", "self", "cumulative"])
+ColdStart = namedtuple("ColdStart", ["day", "startup", "imports", "children"])
+
+
+def main(args):
+    budgets = {day: args.budget for day in args.days}
+    budgets.update(dict(parse_budget(b) for b in args.budget_day))
+
+    exceeded = 0
+    print(f"{'day':>3} {'startup':>10} {'import':>10} {'total':>10} {'budget':>10}")
+    for day in args.days:
+        # the minimum is the most reliable estimate of a cold start
+        runs = [cold_start(day) for _ in range(args.repeat)]
+        cs = min(runs, key=lambda r: r.startup + r.imports)
+
+        total = cs.startup + cs.imports
+        over = total > budgets[day]
+        exceeded += over
+
+        flag = "  OVER BUDGET" if over else ""
+        times = f"{cs.startup:>7.1f} ms {cs.imports:>7.1f} ms {total:>7.1f} ms"
+        print(f"{day:>3} {times} {budgets[day]:>7.0f} ms{flag}")
+
+        # the direct imports of the day that took the longest
+        children = sorted(cs.children, key=lambda c: c.cumulative, reverse=True)
+        for child in children[: args.top]:
+            print(f"{'':>3} {child.cumulative:>7.1f} ms  {child.name}")
+
+    if exceeded:
+        print(f"\n{exceeded} days exceed their cold start budget")
+
+    return 1 if exceeded else 0
+
+
+def cold_start(day):
+    # import the day in a fresh interpreter, so that nothing is cached yet
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import day{day}"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = parse_importtime(proc.stderr)
+    index = next(i for i, imp in enumerate(imports) if imp.name == f"day{day}")
+
+    # everything at the top level before the day itself is interpreter startup
+    startup = sum(imp.cumulative for imp in imports[:index] if imp.level == 0)
+
+    # the output lists children before their parent, one level deeper
+    children = []
+    for imp in reversed(imports[:index]):
+        if imp.level == 0:
+            break
+        if imp.level == 1:
+            children.append(imp)
+
+    return ColdStart(day, startup, imports[index].cumulative, children)
+
+
+def parse_importtime(stderr):
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        selftime, cumulative, name = line[len("import time:") :].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(
+            Import(name.strip(), level, int(selftime) / 1000, int(cumulative) / 1000)
+        )
+
+    return imports
+
+
+def parse_budget(text):
+    day, ms = text.split("=")
+    return int(day), float(ms)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Measure the cold start of all days")
+    parser.add_argument("days", nargs="*", type=int, default=range(1, 26))
+    parser.add_argument("-b", "--budget", type=float, default=100, help="budget in ms")
+    parser.add_argument(
+        "--budget-day", nargs="+", default=[], help="budgets of single days as DAY=MS"
+    )
+    parser.add_argument("-n", "--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=3, help="imports per day")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
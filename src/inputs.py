@@ -0,0 +1,106 @@
+# Advent of Code 2023, Puzzle Inputs
+# (c) blu3r4y
+
+import io
+import mmap
+import sys
+from functools import cache, cached_property
+from pathlib import Path
+
+INPUTS = Path(__file__).parent.parent / "inputs"
+CHUNK_SIZE = 2**16
+
+
+class PuzzleInput:
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            size = fh.seek(0, 2)
+
+            # empty files can not be memory-mapped
+            buffer = b""
+            if size > 0:
+                buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # trailing newlines are not part of the input
+        end = len(buffer)
+        while end > 0 and buffer[end - 1] in b"\r\n":
+            end -= 1
+
+        self.path = path
+        self.buffer = buffer
+        self.bytes = memoryview(buffer)[:end]
+
+    @cached_property
+    def text(self):
+        # decode the whole input only once, no matter how often it is loaded
+        return str(self.bytes, "utf-8")
+
+    def lines(self):
+        # lazily decode one line after the other, straight from the buffer
+        start, end = 0, len(self.bytes)
+        while start <= end:
+            stop = self.buffer.find(b"\n", start, end)
+            stop = end if stop < 0 else stop
+            yield str(self.bytes[start:stop], "utf-8")
+            start = stop + 1
+
+
+def split_lines(data):
+    # inputs are either the whole text, or any iterable of lines, e.g.,
+    # a file object or PuzzleInput.lines(), which is only consumed lazily
+    if isinstance(data, str):
+        data = io.StringIO(data)
+
+    for line in data:
+        yield line.rstrip("\r\n")
+
+
+def split_records(data, sep):
+    # like split_lines, but for records that are separated by something else,
+    # so the text is consumed in chunks that might end within a record
+    chunks = data
+    if isinstance(data, str):
+        chunks = (data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+
+    rest = ""
+    for chunk in chunks:
+        *records, rest = (rest + chunk.rstrip("\r\n")).split(sep)
+        yield from records
+
+    yield rest
+
+
+def input_path(day):
+    return INPUTS / f"day{day}.txt"
+
+
+@cache
+def puzzle_input(day):
+    path = input_path(day)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"no input for day {day} at {path}, "
+            f"fetch it with 'python src/inputs.py {day}'"
+        )
+
+    return PuzzleInput(path)
+
+
+def read_input(day):
+    return puzzle_input(day).text
+
+
+def fetch_inputs(days):
+    # the only place that needs the network and an aocd token
+    from aocd.models import Puzzle
+
+    INPUTS.mkdir(exist_ok=True)
+    for day in days:
+        path = input_path(day)
+        if not path.exists():
+            path.write_text(Puzzle(year=2023, day=day).input_data, encoding="utf-8")
+            print(f"fetched {path}")
+
+
+if __name__ == "__main__":
+    fetch_inputs(map(int, sys.argv[1:]) if len(sys.argv) > 1 else range(1, 26))
@@ -0,0 +1,213 @@
+# Advent of Code 2023, Instrumentation
+# (c) blu3r4y
+
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+PROFILES = Path(__file__).parent.parent / "profiles"
+MODES = ("off", "timing", "profile", "sample")
+
+# the mode is read from the environment, so that it is inherited by worker processes
+MODE = os.environ.get("AOC_INSTRUMENT", "off")
+ONLY = [o for o in os.environ.get("AOC_INSTRUMENT_ONLY", "").split(",") if o]
+
+# all functions that were decorated so far, by their qualified name
+REGISTRY = {}
+
+# counters of the hot paths, by scope, which are only collected if enabled
+COUNTING = os.environ.get("AOC_COUNTERS", "") == "1"
+COUNTERS = defaultdict(Counter)
+
+
+def instrument(func):
+    name = f"{Path(func.__globals__['__file__']).stem}.{func.__name__}"
+    REGISTRY[name] = func
+
+    # in the default mode, the function is returned as is, without any overhead
+    return wrap(func, name) if is_selected(name) else func
+
+
+def configure(mode, only=None):
+    global MODE, ONLY
+    if mode not in MODES:
+        raise ValueError(f"unknown instrumentation mode: {mode}")
+
+    MODE, ONLY = mode, list(only or [])
+    os.environ["AOC_INSTRUMENT"] = MODE
+    os.environ["AOC_INSTRUMENT_ONLY"] = ",".join(ONLY)
+
+    # re-bind the already decorated functions within their modules
+    for name, func in REGISTRY.items():
+        func.__globals__[func.__name__] = (
+            wrap(func, name) if is_selected(name) else func
+        )
+
+
+def is_selected(name):
+    if MODE == "off":
+        return False
+
+    # select by day (e.g. "day12") or by part (e.g. "day12.part2")
+    return not ONLY or any(name == o or name.startswith(f"{o}.") for o in ONLY)
+
+
+def counters(scope):
+    # algorithms fetch their counters once, outside of their hot loops,
+    # and only count if they got any, so that disabled counters cost
+    # no more than checking a local variable against none
+    return COUNTERS[scope] if COUNTING else None
+
+
+@contextmanager
+def counting_cache(func, scope):
+    # count the hits and misses of a function wrapped by functools.cache or memoize
+    if not COUNTING:
+        yield
+        return
+
+    before = func.cache_info()
+    try:
+        yield
+    finally:
+        after = func.cache_info()
+        COUNTERS[scope]["hits"] += after.hits - before.hits
+        COUNTERS[scope]["misses"] += after.misses - before.misses
+
+        # bounded memos also report how many entries they had to evict
+        if hasattr(after, "evictions"):
+            COUNTERS[scope]["evictions"] += after.evictions - before.evictions
+
+
+def enable_counters(enabled=True):
+    global COUNTING
+    COUNTING = enabled
+    os.environ["AOC_COUNTERS"] = "1" if enabled else ""
+
+
+def collect_counters():
+    # all counters since the last collection, flattened by their qualified name
+    result = {
+        f"{scope}.{name}": value
+        for scope, counter in COUNTERS.items()
+        for name, value in sorted(counter.items())
+    }
+
+    COUNTERS.clear()
+    return result
+
+
+def wrap(func, name):
+    match MODE:
+        case "timing":
+            return timed(func, name)
+        case "profile":
+            return profiled(func, name)
+        case "sample":
+            return sampled(func, name)
+
+    raise ValueError(f"unknown instrumentation mode: {MODE}")
+
+
+def timed(func, name):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        duration = (time.perf_counter() - start) * 1000
+        print(f"{name} -> {result} ({duration:.2f} ms)")
+        return result
+
+    return wrapper
+
+
+def profiled(func, name):
+    # profilers are only imported when they are used, to keep the startup short
+    import cProfile
+    import pstats
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args, **kwargs)
+
+        PROFILES.mkdir(exist_ok=True)
+        profiler.dump_stats(PROFILES / f"{name}.prof")
+
+        print(f"{name} -> {result}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+        return result
+
+    return wrapper
+
+
+def sampled(func, name):
+    import threading
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        sampler = Sampler(threading.get_ident())
+        sampler.start()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            sampler.stop()
+
+        # stacks in the folded format, as expected by flamegraph.pl or speedscope
+        PROFILES.mkdir(exist_ok=True)
+        path = PROFILES / f"{name}.folded"
+        sampler.dump(path)
+
+        print(f"{name} -> {result} ({sampler.num_samples} samples in {path})")
+        return result
+
+    return wrapper
+
+
+class Sampler:
+    def __init__(self, ident, interval=0.001):
+        import threading
+
+        self.ident = ident
+        self.interval = interval
+        self.stacks = Counter()
+        self.num_samples = 0
+        self.running = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.switchinterval = sys.getswitchinterval()
+
+    def start(self):
+        # let the sampler thread acquire the interpreter lock more often
+        sys.setswitchinterval(self.interval / 2)
+        self.running.set()
+        self.thread.start()
+
+    def stop(self):
+        self.running.clear()
+        self.thread.join()
+        sys.setswitchinterval(self.switchinterval)
+
+    def run(self):
+        while self.running.is_set():
+            if frame := sys._current_frames().get(self.ident):
+                self.stacks[self.collapse(frame)] += 1
+                self.num_samples += 1
+            time.sleep(self.interval)
+
+    def collapse(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{Path(code.co_filename).stem}.{code.co_name}")
+            frame = frame.f_back
+
+        return ";".join(reversed(stack))
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
@@ -0,0 +1,31 @@
+# Advent of Code 2023, Lazy Imports
+# (c) blu3r4y
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
+
+    # the module is only executed on the first attribute access,
+    # so that heavy dependencies do not slow down the interpreter startup
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def preload(module):
+    # execute the lazy imports of a module right away, e.g., in warm workers,
+    # by accessing an attribute of every module that it imported
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            getattr(value, "__name__")
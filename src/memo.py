@@ -0,0 +1,152 @@
+# Advent of Code 2023, Memoization
+# (c) blu3r4y
+
+import gc
+import os
+import sys
+from collections import defaultdict, namedtuple
+from functools import cache
+from itertools import islice
+from weakref import WeakSet
+
+# the default memory budget of every memo, in megabytes
+BUDGET = int(os.environ.get("AOC_MEMO_BUDGET", 256)) * 2**20
+
+# the size of that many entries is measured to estimate the size of a memo
+SAMPLING = 64
+
+# all memos that are alive, by their scope, e.g., "day12" or "day14.part2"
+SCOPES = defaultdict(WeakSet)
+
+# the same fields as functools.cache_info(), plus evictions and size in bytes
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "evictions", "nbytes"]
+)
+
+
+class Memo:
+    # the bookkeeping of a function that is memoized by functools.cache,
+    # whose lookups stay in c, so the memory budget is not enforced on every
+    # call, but only when the memo is checked, e.g., in between two inputs
+
+    def __init__(self, scope, cached, budget=None):
+        self.scope = scope
+        self.cached = cached
+        self.budget = BUDGET if budget is None else budget
+
+        # the methods of functools, before the wrapper exposes the ones below
+        self.info, self.reset = cached.cache_info, cached.cache_clear
+
+        # functools resets its statistics on every clear, so they add up here
+        self.hits = self.misses = self.evictions = 0
+
+        SCOPES[scope].add(self)
+
+    def entries(self):
+        # functools does not expose its cache, but the wrapper refers to it
+        return next(
+            r
+            for r in gc.get_referents(self.cached)
+            if isinstance(r, dict) and r is not self.cached.__dict__
+        )
+
+    def __len__(self):
+        return self.info().currsize
+
+    @property
+    def nbytes(self):
+        # measuring every entry would take longer than filling the cache,
+        # so the size is estimated from the first few entries
+        entries = self.entries()
+        sample = list(islice(entries.items(), SAMPLING))
+        if not sample:
+            return 0
+
+        size = sum(sizeof(key) + sizeof(value) for key, value in sample)
+        return len(entries) * size // len(sample)
+
+    def check(self):
+        # the cache has no order to evict by, so all entries go at once
+        if len(self) > 0 and self.nbytes > self.budget:
+            self.evictions += len(self)
+            self.clear()
+
+    def clear(self):
+        # drop the entries, but keep the statistics, e.g., between inputs
+        info = self.info()
+        self.hits += info.hits
+        self.misses += info.misses
+        self.reset()
+
+    def cache_info(self):
+        info = self.info()
+        return CacheInfo(
+            self.hits + info.hits,
+            self.misses + info.misses,
+            self.budget,
+            info.currsize,
+            self.evictions,
+            self.nbytes,
+        )
+
+    def cache_clear(self):
+        self.reset()
+        self.hits = self.misses = self.evictions = 0
+
+
+def memoize(scope, budget=None):
+    # functools.cache, but registered under a scope and bounded by a budget,
+    # which is checked by memo.check or dropped entirely by memo.clear
+    def decorator(func):
+        cached = cache(func)
+        memo = Memo(scope, cached, budget)
+
+        cached.memo = memo
+        cached.cache_info = memo.cache_info
+        cached.cache_clear = memo.cache_clear
+        return cached
+
+    return decorator
+
+
+def sizeof(obj):
+    # the size of the object and of the tuples within it, while their other
+    # elements are usually small ints or characters that are shared anyway
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(sizeof(o) for o in obj if isinstance(o, tuple))
+    return size
+
+
+def memos(scope=None):
+    # the memos of a scope and its sub-scopes, or simply all memos
+    for name, scoped in list(SCOPES.items()):
+        if scope is None or name == scope or name.startswith(f"{scope}."):
+            yield from ((name, memo) for memo in scoped)
+
+
+def check(scope=None):
+    # drop the entries of the memos that exceed their budget
+    for _, memo in memos(scope):
+        memo.check()
+
+
+def clear(scope=None):
+    # drop the entries of the memos, while their statistics keep counting
+    for _, memo in memos(scope):
+        memo.clear()
+
+
+def stats(scope=None):
+    result, seen = {}, defaultdict(int)
+    for name, memo in sorted(memos(scope), key=lambda m: m[0]):
+        info = memo.cache_info()
+        lookups = info.hits + info.misses
+
+        i, seen[name] = seen[name], seen[name] + 1
+        result[name if i == 0 else f"{name}#{i}"] = {
+            **info._asdict(),
+            "hit_rate": info.hits / lookups if lookups else None,
+        }
+
+    return result
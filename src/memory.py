@@ -0,0 +1,117 @@
+# Advent of Code 2023, Memory Profiling
+# (c) blu3r4y
+
+import sys
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
+MemoryStats = namedtuple("MemoryStats", ["peak_rss", "peak_traced", "top_sites"])
+
+
+def trace_memory(func, *args, limit=10):
+    tracemalloc.start()
+    tracker = PeakTracker()
+    tracker.start()
+    try:
+        result = func(*args)
+    finally:
+        tracker.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return result, MemoryStats(peak_rss(), peak, top_sites(tracker.snapshot, limit))
+
+
+def reset_caches(module):
+    # memoized functions would turn every repeated run into a cache lookup,
+    # while classes like Memo only have the unbound method
+    for obj in vars(module).values():
+        if not isinstance(obj, type) and callable(getattr(obj, "cache_clear", None)):
+            obj.cache_clear()
+
+
+def peak_rss():
+    if resource is None:
+        return None
+
+    # the maximum resident set size is reported in kilobytes on linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def top_sites(snapshot, limit):
+    if snapshot is None:
+        return []
+
+    # the peak tracker allocates too, e.g., when threading adds it to a weakset
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, "*/_weakrefset.py"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+
+    sites = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        sites.append(
+            (f"{Path(frame.filename).name}:{frame.lineno}", stat.size, stat.count)
+        )
+
+    return sites
+
+
+class PeakTracker:
+    # tracemalloc only remembers the size of the peak, not what was allocated,
+    # so this takes a new snapshot whenever the traced memory grew significantly
+
+    def __init__(self, interval=0.01, growth=1.1):
+        self.interval = interval
+        self.growth = growth
+        self.size = 0
+        self.snapshot = None
+        self.running = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.running.set()
+        self.thread.start()
+
+    def stop(self):
+        self.running.clear()
+        self.thread.join()
+        self.track()
+
+    def run(self):
+        while self.running.is_set():
+            self.track()
+            time.sleep(self.interval)
+
+    def track(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+
+def format_bytes(size):
+    if size is None:
+        return "-"
+
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
@@ -0,0 +1,170 @@
+# Advent of Code 2023, Parse Cache
+# (c) blu3r4y
+
+import hashlib
+import inspect
+import os
+import pickle
+import struct
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import suppress
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+
+SRC = Path(__file__).parent
+CACHE = SRC.parent / ".cache" / "parsed"
+CACHE = Path(os.environ.get("AOC_PARSE_CACHE", CACHE))
+MAX_DISK_SIZE = int(os.environ.get("AOC_PARSE_CACHE_SIZE", 256)) * 2**20
+MAX_MEMORY_SIZE = 64 * 2**20
+
+# serialized results of this process, so that both parts share one parse
+MEMORY = OrderedDict()
+
+ALIGNMENT = 64
+
+
+def cached_load(load, data, *args, **kwargs):
+    key = cache_key(load, data, args, kwargs)
+
+    if (blob := MEMORY.get(key)) is not None:
+        MEMORY.move_to_end(key)
+        return deserialize(blob)
+
+    path = CACHE / f"{key}.bin"
+    if path.exists():
+        blob = path.read_bytes()
+        os.utime(path)  # remember when it was used last, for eviction
+        remember(key, blob)
+        return deserialize(blob)
+
+    result = load(data, *args, **kwargs)
+
+    # lazy loaders have to be consumed, since only values can be stored
+    if isinstance(result, Iterator):
+        result = list(result)
+
+    blob = serialize(result)
+    remember(key, blob)
+    store(path, blob)
+
+    return result
+
+
+def cache_key(load, data, args, kwargs):
+    # the input, the loader's source and its arguments define the parsed result
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(data.encode() if isinstance(data, str) else data)
+    digest.update(load.__module__.encode())
+    digest.update(source_digest(load.__module__))
+    digest.update(repr((args, sorted(kwargs.items()))).encode())
+    return digest.hexdigest()
+
+
+@cache
+def source_digest(name):
+    # the source of the loader's module and of all local modules it relies on,
+    # since helpers like Grid.from_bytes or the tokenizer shape the result too,
+    # as does the serialization format of this module
+    local = {path.stem for path in SRC.glob("*.py")}
+    names = {id(module): n for n, module in sys.modules.items()}
+
+    digest = hashlib.blake2b(digest_size=16)
+    seen, pending = set(), [name, __name__]
+    while pending:
+        if (name := pending.pop()) in seen:
+            continue
+        seen.add(name)
+
+        module = sys.modules[name]
+        digest.update(inspect.getsource(module).encode())
+
+        # modules are identified without touching them, since that would
+        # execute lazy imports like numpy
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                dependency = names.get(id(value))
+            else:
+                dependency = getattr(value, "__module__", None)
+            if dependency in local and dependency in sys.modules:
+                pending.append(dependency)
+
+    return digest.digest()
+
+
+def serialize(obj):
+    # numpy arrays are written out-of-band, so they are not copied into the pickle
+    buffers = []
+    head = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+
+    sizes = [len(head)] + [r.nbytes for r in raws]
+    header = struct.pack(f"<Q{len(sizes)}Q", len(sizes), *sizes)
+
+    # align every buffer, so that arrays do not end up on unaligned memory
+    chunks, offset = [header], len(header)
+    for chunk in [head] + raws:
+        padding = -offset % ALIGNMENT
+        chunks.extend([bytes(padding), chunk])
+        offset += padding + len(chunk)
+
+    return b"".join(chunks)
+
+
+def deserialize(blob, copy=True):
+    # copy into a writable buffer, so that loaded arrays can be modified in-place,
+    # or map them read-only onto the blob itself, e.g., onto shared memory
+    view = memoryview(bytearray(blob)) if copy else memoryview(blob).toreadonly()
+
+    (count,) = struct.unpack_from("<Q", view)
+    sizes = struct.unpack_from(f"<{count}Q", view, 8)
+
+    chunks, offset = [], 8 + 8 * count
+    for size in sizes:
+        offset += -offset % ALIGNMENT
+        chunks.append(view[offset : offset + size])
+        offset += size
+
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+def remember(key, blob):
+    MEMORY[key] = blob
+    while sum(map(len, MEMORY.values())) > MAX_MEMORY_SIZE and len(MEMORY) > 1:
+        MEMORY.popitem(last=False)
+
+
+def store(path, blob):
+    CACHE.mkdir(parents=True, exist_ok=True)
+
+    # write atomically, since other processes might read the same entry
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+
+    evict()
+
+
+def evict():
+    # drop the least recently used entries until the cache fits its size limit
+    entries = []
+    for path in CACHE.glob("*.bin"):
+        with suppress(FileNotFoundError):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= MAX_DISK_SIZE:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def clear():
+    MEMORY.clear()
+    for path in CACHE.glob("*.bin"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,337 @@
+# Advent of Code 2023, Runner
+# (c) blu3r4y
+
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import instrument
+import memo
+from inputs import read_input
+from lazy import preload
+from memory import format_bytes, peak_rss, reset_caches, trace_memory
+from parsecache import cached_load
+from shared import attach, detach, release, share
+
+README = Path(__file__).parent.parent / "README.md"
+
+# the answers that are asserted in the main block of each day
+ANSWERS = {
+    (1, 1): 54667,
+    (1, 2): 54203,
+    (2, 1): 2169,
+    (2, 2): 60948,
+    (3, 1): 543867,
+    (3, 2): 79613331,
+    (4, 1): 27454,
+    (4, 2): 6857330,
+    (5, 1): 3374647,
+    (5, 2): 6082852,
+    (6, 1): 2374848,
+    (6, 2): 39132886,
+    (7, 1): 246424613,
+    (7, 2): 248256639,
+    (8, 1): 16409,
+    (8, 2): 11795205644011,
+    (9, 1): 1974913025,
+    (9, 2): 884,
+    (10, 1): 6828,
+    (10, 2): 459,
+    (11, 1): 9965032,
+    (11, 2): 550358864332,
+    (12, 1): 7047,
+    (12, 2): 17391848518844,
+    (13, 1): 31877,
+    (13, 2): 42996,
+    (14, 1): 106186,
+    (14, 2): 106390,
+    (15, 1): 514025,
+    (15, 2): 244461,
+    (16, 1): 8389,
+    (16, 2): 8564,
+    (17, 1): 755,
+    (17, 2): 881,
+    (18, 1): 95356,
+    (18, 2): 92291468914147,
+    (19, 1): 331208,
+    (19, 2): 121464316215623,
+    (20, 1): 929810733,
+    (20, 2): 231657829136023,
+    (21, 1): 3751,
+    (21, 2): 619407349431167,
+    (22, 1): 443,
+    (22, 2): 69915,
+    (23, 1): 2190,
+    (23, 2): 6258,
+    (24, 1): 25810,
+    (24, 2): 652666650475950,
+    (25, 1): 538560,
+}
+
+Result = namedtuple(
+    "Result",
+    ["day", "part", "answer", "load", "solve", "cpu", "memory", "counters", "error"],
+    defaults=[None, None, None],
+)
+
+
+def main(args):
+    instrument.configure(args.instrument, args.only)
+    instrument.enable_counters(args.counters)
+
+    jobs = [job for job in ANSWERS if job[0] in args.days]
+    estimates = estimate_durations(args.timings)
+
+    # schedule the longest jobs first, so that the slowest part
+    # starts right away and the short ones fill up the other workers
+    jobs.sort(key=lambda job: estimates.get(job, 0), reverse=True)
+
+    # with memory profiling, every part gets a fresh process,
+    # so that the peak resident set size is not shared among parts
+    max_tasks = 1 if args.memory else None
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, max_tasks_per_child=max_tasks) as pool:
+        if args.shared:
+            results = run_shared(pool, jobs, args.memory)
+        else:
+            futures = [
+                pool.submit(run_part, day, part, args.memory, args.cache)
+                for day, part in jobs
+            ]
+            results = [f.result() for f in futures]
+    wall = time.perf_counter() - start
+
+    status = report(sorted(results), wall)
+    if args.memory:
+        report_memory(sorted(results), args.top)
+    if args.counters:
+        report_counters(sorted(results))
+
+    return status
+
+
+def run_shared(pool, jobs, memory=False):
+    # parse every input only once, and let all parts that load it the same way
+    # run concurrently on the same shared memory, without copying the arrays
+    blocks, loads, errors, futures, failed = {}, {}, {}, [], []
+    try:
+        for day, part in jobs:
+            module = importlib.import_module(f"day{day}")
+            key = day, repr(loader_args(module, part))
+
+            if key not in blocks and key not in errors:
+                tstart = time.perf_counter()
+                try:
+                    blocks[key] = share(load_input(module, part, read_input(day)))
+                except Exception as e:
+                    errors[key] = repr(e)
+                loads[key] = time.perf_counter() - tstart
+
+            # the parts that would have shared a failed input fail as well
+            if key in errors:
+                failed.append(
+                    Result(day, part, None, loads[key], 0, 0, error=errors[key])
+                )
+                continue
+
+            name = blocks[key].name
+            future = pool.submit(run_part, day, part, memory, shared=name)
+            futures.append((future, loads[key]))
+
+        # the parsing happened only once, but is accounted for in every part
+        return [f.result()._replace(load=load) for f, load in futures] + failed
+    finally:
+        for block in blocks.values():
+            release(block)
+
+
+def run_part(day, part, memory=False, cache=False, shared=None):
+    module = importlib.import_module(f"day{day}")
+    data = None if shared else read_input(day)
+
+    def run():
+        tstart = time.perf_counter()
+        if shared:
+            parsed = attach(shared)
+        else:
+            parsed = load_input(module, part, data, cache)
+        tload = time.perf_counter()
+        answer = solver(module, part)(parsed)
+        return answer, tload - tstart, time.perf_counter() - tload
+
+    # only count what happens within this part
+    instrument.collect_counters()
+
+    cpu, stats, error = time.process_time(), None, None
+    try:
+        answer, load, solve = run()
+    except Exception as e:
+        # one failing part should not stop the whole run
+        answer, load, solve, error = None, 0, 0, repr(e)
+    cpu = time.process_time() - cpu
+    counters = instrument.collect_counters()
+
+    # the memos outside of the hot paths are only held to their budget here
+    memo.check()
+
+    # tracing slows down the part and inflates its resident set size,
+    # so the memory is traced in a second run, on the same empty caches,
+    # with the lazy imports done upfront, so that they are not traced
+    if memory and error is None:
+        rss = peak_rss()
+        reset_caches(module)
+        preload(module)
+        _, stats = trace_memory(run)
+        stats = stats._replace(peak_rss=rss)
+
+    if shared:
+        detach(shared)
+
+    return Result(day, part, answer, load, solve, cpu, stats, counters, error)
+
+
+def load_input(module, part, data, cache=False):
+    load = partial(cached_load, module.load) if cache else module.load
+    args, kwargs = loader_args(module, part)
+    return load(data, *args, **kwargs)
+
+
+def loader_args(module, part):
+    # some days need a different loader configuration for the second part
+    match module.__name__, part:
+        case "day7", 1:
+            return (module.RANKS_PART1,), {}
+        case "day7", 2:
+            return (module.RANKS_PART2,), {}
+        case "day18", 2:
+            return (), {"decode_hex": True}
+
+    return (), {}
+
+
+def solver(module, part):
+    return getattr(module, f"part{part}")
+
+
+def report(results, wall):
+    failed = 0
+
+    print(f"{'day':>3} {'part':>4} {'answer':>16} {'load':>10} {'solve':>10}")
+    for r in results:
+        ok = r.error is None and r.answer == ANSWERS[(r.day, r.part)]
+        failed += not ok
+
+        load, solve = format_ms(r.load), format_ms(r.solve)
+        # sympy integers do not support format specs
+        answer = "-" if r.error else str(r.answer)
+        status = "" if ok else f"  expected {ANSWERS[(r.day, r.part)]}"
+        if r.error:
+            status = f"  failed with {r.error}"
+        print(f"{r.day:>3} {r.part:>4} {answer:>16} {load:>10} {solve:>10}{status}")
+
+    total = format_ms(sum(r.load + r.solve for r in results))
+    cpu = format_ms(sum(r.cpu for r in results))
+    print(f"\nwall time {format_ms(wall)}, sum of parts {total}, cpu time {cpu}")
+
+    if failed:
+        print(f"{failed} of {len(results)} answers are wrong or failed")
+
+    return 1 if failed else 0
+
+
+def report_memory(results, top):
+    print(f"\n{'day':>3} {'part':>4} {'peak rss':>12} {'peak traced':>12}")
+    for r in results:
+        if r.memory is None:
+            continue
+
+        rss, traced = format_bytes(r.memory.peak_rss), format_bytes(
+            r.memory.peak_traced
+        )
+        print(f"{r.day:>3} {r.part:>4} {rss:>12} {traced:>12}")
+
+        # the allocation sites that hold most of the memory around the peak
+        for site, size, count in r.memory.top_sites[:top]:
+            print(f"{'':>9} {format_bytes(size):>12}  {site} ({count} blocks)")
+
+
+def report_counters(results):
+    print(f"\n{'day':>3} {'part':>4} {'count':>16}  counter")
+    for r in results:
+        for name, value in r.counters.items():
+            print(f"{r.day:>3} {r.part:>4} {value:>16}  {name}")
+
+
+def estimate_durations(timings=None):
+    # prefer measured durations from the benchmarks, if available
+    if timings:
+        with open(timings, encoding="utf-8") as fh:
+            results = json.load(fh)["results"]
+
+        estimates = {}
+        for key, r in results.items():
+            day, part = map(int, key.split("."))
+            estimates[(day, part)] = r["load"]["median"] + r["solve"]["median"]
+
+        return estimates
+
+    # otherwise, read the past durations in milliseconds from the readme table
+    estimates = {}
+    for line in README.read_text(encoding="utf-8").splitlines():
+        cells = [c.strip() for c in line.strip().strip("|").split("|")]
+        if len(cells) == 5 and cells[0].isnumeric():
+            day = int(cells[0])
+            estimates[(day, 1)] = parse_duration(cells[3])
+            estimates[(day, 2)] = parse_duration(cells[4])
+
+    return estimates
+
+
+def parse_duration(text):
+    # durations look like "26 ms", "1.044 ms" or "**1 min 18 sec**",
+    # while empty durations indicate a runtime of less than ten milliseconds
+    text = text.strip("* ")
+    if m := re.fullmatch(r"(\d+) min (\d+) sec", text):
+        return (int(m[1]) * 60 + int(m[2])) * 1000
+    if m := re.fullmatch(r"([\d.]+) ms", text):
+        return int(m[1].replace(".", ""))
+
+    return 0
+
+
+def format_ms(seconds):
+    return f"{seconds * 1000:.0f} ms"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Run all days in parallel")
+    parser.add_argument("days", nargs="*", type=int, default=range(1, 26))
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("-t", "--timings", help="benchmark results to schedule by")
+    parser.add_argument("-i", "--instrument", choices=instrument.MODES, default="off")
+    parser.add_argument("--only", nargs="+", help="instrument only these days or parts")
+    parser.add_argument(
+        "-c", "--cache", action="store_true", help="cache parsed inputs"
+    )
+    parser.add_argument("-m", "--memory", action="store_true", help="profile memory")
+    parser.add_argument("--top", type=int, default=3, help="allocation sites per part")
+    parser.add_argument(
+        "-s", "--shared", action="store_true", help="share parsed inputs among parts"
+    )
+    parser.add_argument(
+        "-k", "--counters", action="store_true", help="report hot path counters"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,53 @@
+# Advent of Code 2023, Shared Memory
+# (c) blu3r4y
+
+from collections.abc import Iterator
+from contextlib import suppress
+from multiprocessing.shared_memory import SharedMemory
+
+from parsecache import deserialize, serialize
+
+# the blocks this process attached to, which have to stay open while in use
+ATTACHED = {}
+
+
+def share(obj):
+    # lazy loaders have to be consumed, since only values can be shared
+    if isinstance(obj, Iterator):
+        obj = list(obj)
+
+    # numpy arrays end up as aligned out-of-band buffers in the block,
+    # while everything else is pickled and copied again on every attach
+    blob = serialize(obj)
+    block = SharedMemory(create=True, size=max(len(blob), 1))
+    block.buf[: len(blob)] = blob
+
+    return block
+
+
+def attach(name):
+    # the same block is only attached once, even if it is loaded repeatedly
+    if name not in ATTACHED:
+        ATTACHED[name] = SharedMemory(name)
+    block = ATTACHED[name]
+
+    # the arrays are read-only views onto the shared block, see writable()
+    return deserialize(block.buf, copy=False)
+
+
+def detach(name):
+    if block := ATTACHED.pop(name, None):
+        # arrays that are still referenced somewhere keep the block mapped,
+        # which is released when the process exits at the latest
+        with suppress(BufferError):
+            block.close()
+
+
+def release(block):
+    block.close()
+    block.unlink()
+
+
+def writable(array):
+    # copy-on-write for parts that modify their input in-place
+    return array if array.flags.writeable else array.copy()
@@ -0,0 +1,46 @@
+# Advent of Code 2023, Tokenizer
+# (c) blu3r4y
+
+import re
+from functools import cache
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+INTEGER = re.compile(r"-?\d+")
+
+
+def integers(text, columns=None):
+    # all integers of the text in one pass, optionally as rows of some columns
+    numbers = np.array(list(map(int, INTEGER.findall(text))), dtype=np.int64)
+    return numbers if columns is None else numbers.reshape(-1, columns)
+
+
+def records(text, pattern):
+    # the groups of all matches of the pattern in one pass, column by column
+    pattern = compile_pattern(pattern)
+    matches = pattern.findall(text)
+
+    # findall returns strings for a single group, and nothing to zip if empty
+    if pattern.groups == 1:
+        return (matches,)
+    if not matches:
+        return tuple([] for _ in range(pattern.groups))
+    return tuple(map(list, zip(*matches)))
+
+
+def scan(data, pattern):
+    # the matches of the pattern in the whole text at once,
+    # or line by line if the input is any other iterable of lines
+    pattern = compile_pattern(pattern)
+    if isinstance(data, str):
+        yield from pattern.finditer(data)
+    else:
+        for line in data:
+            yield from pattern.finditer(line)
+
+
+@cache
+def compile_pattern(pattern):
+    return re.compile(pattern)